@@ -24,3 +24,20 @@ def test(session):
 def test_full(session):
     session.install(".[dev]")
     session.run("uv", "run", "pytest")
+
+
+@nox.session(python=["3.13"], default=False)
+def build_binary(session):
+    # Ahead-of-time compiled CLI binary for distribution; skips the CPython
+    # import/loader overhead on startup. Not part of the normal test matrix.
+    session.install(".", "nuitka")
+    session.run(
+        "python",
+        "-m",
+        "nuitka",
+        "--standalone",
+        "--onefile",
+        "--include-package=nauyaca",
+        "--output-filename=nauyaca",
+        "src/nauyaca/__main__.py",
+    )
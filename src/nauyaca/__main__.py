@@ -4,34 +4,164 @@ This module provides a command-line interface for the Nauyaca Gemini client.
 """
 
 import asyncio
+import functools
+import sys
+from collections.abc import Callable, Coroutine
 from importlib.metadata import version as get_version
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
-from .client.session import GeminiClient
 from .protocol.constants import DEFAULT_PORT, MAX_REDIRECTS
-from .protocol.response import GeminiResponse
-from .protocol.status import interpret_status
-from .security.tofu import CertificateChangedError
-from .server.config import ServerConfig
-from .server.server import start_server
+
+if TYPE_CHECKING:
+    from .protocol.response import GeminiResponse
+    from .security.tofu import TOFUDatabase
 
 # Create console instances
 console = Console()
 error_console = Console(stderr=True, style="bold red")
 
-app = typer.Typer(
-    name="nauyaca",
-    help="Nauyaca - A modern Gemini protocol client",
-    add_completion=True,
-    no_args_is_help=True,
-)
+# Bodies above this size bypass Rich and go straight to stdout
+_LARGE_BODY_THRESHOLD = 64 * 1024
+
+# Pre-built markup templates for response display, so the format strings are
+# parsed once at import rather than per response
+_STATUS_CELL = "[{style}]{status}[/] ({text})"
+_ERROR_LINE = "[{style}][{status}][/] {meta}"
+
+
+def _cancel_pending_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    """Cancel and drain any tasks still pending on the loop.
+
+    Mirrors asyncio.run's shutdown sequence: background tasks (rate-limiter
+    cleanup, in-flight connection handlers) receive CancelledError and run
+    their cleanup instead of being destroyed while pending at loop close.
+
+    Args:
+        loop: The event loop being shut down.
+    """
+    pending = asyncio.all_tasks(loop)
+    if not pending:
+        return
+    for task in pending:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+    for task in pending:
+        if task.cancelled():
+            continue
+        if task.exception() is not None:
+            loop.call_exception_handler(
+                {
+                    "message": "unhandled exception during event loop shutdown",
+                    "exception": task.exception(),
+                    "task": task,
+                }
+            )
+
+
+def _run(coro: Coroutine[Any, Any, None]) -> None:
+    """Run a coroutine to completion, preferring uvloop when installed.
+
+    uvloop is an optional dependency; when it is missing (or on Windows,
+    where it is unsupported) this falls back to the stock asyncio loop.
+
+    Args:
+        coro: The coroutine to run.
+    """
+    loop: asyncio.AbstractEventLoop | None = None
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            loop = uvloop.new_event_loop()
+
+    # Manage the loop directly instead of going through asyncio.run, which
+    # re-does policy lookups and loop-factory resolution on every CLI call.
+    if loop is None:
+        loop = asyncio.new_event_loop()
+    try:
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(coro)
+    finally:
+        try:
+            _cancel_pending_tasks(loop)
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+
+_CommandCoro = Callable[..., Coroutine[Any, Any, None]]
 
 
-def _format_response(response: GeminiResponse, verbose: bool = False) -> None:
+def _cli_errors(
+    prefixes: dict[type[Exception], str],
+) -> Callable[[_CommandCoro], _CommandCoro]:
+    """Map known exceptions from a command coroutine to CLI error output.
+
+    Each caught exception is printed as ``<prefix>: <message>`` on the error
+    console and converted into ``typer.Exit(code=1)``. Exception types are
+    matched in mapping order (mirroring an ``except`` ladder), anything else
+    falls through to a generic "Unexpected error" handler, and ``typer.Exit``
+    is re-raised untouched.
+
+    Args:
+        prefixes: Mapping of exception type to the message prefix to display.
+    """
+
+    def decorator(coro_fn: _CommandCoro) -> _CommandCoro:
+        @functools.wraps(coro_fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> None:
+            try:
+                await coro_fn(*args, **kwargs)
+            except typer.Exit:
+                raise
+            except tuple(prefixes) as e:
+                for exc_type, prefix in prefixes.items():
+                    if isinstance(e, exc_type):
+                        error_console.print(f"{prefix}: {e}")
+                        break
+                raise typer.Exit(code=1) from e
+            except Exception as e:
+                error_console.print(f"Unexpected error: {e}")
+                raise typer.Exit(code=1) from e
+
+        return wrapper
+
+    return decorator
+
+
+@functools.lru_cache(maxsize=1)
+def _tofu_db() -> "TOFUDatabase":
+    """Return the process-wide TOFU database used by the tofu commands.
+
+    Opening the database pays for schema initialization, so the instance is
+    shared across the subcommand bodies instead of rebuilt per call site.
+    """
+    from .security.tofu import TOFUDatabase
+
+    return TOFUDatabase()
+
+
+# Rich style per status-code category (first digit); anything else is red
+_STATUS_STYLE = {
+    2: "bold green",
+    3: "bold yellow",
+    4: "bold orange1",
+}
+
+
+def _status_style(status: int) -> str:
+    """Return the Rich style for a status code, keyed on its first digit."""
+    return _STATUS_STYLE.get(status // 10, "bold red")
+
+
+def _format_response(response: "GeminiResponse", verbose: bool = False) -> None:
     """Format and print a Gemini response for display.
 
     Args:
@@ -39,26 +169,22 @@ def _format_response(response: GeminiResponse, verbose: bool = False) -> None:
         verbose: Whether to show verbose output with headers.
     """
     if verbose:
+        from rich.table import Table
+
+        from .protocol.status import interpret_status
+
         # Show full response details in a table
         table = Table(show_header=False, box=None, padding=(0, 1))
         table.add_column("Key", style="bold cyan", no_wrap=True)
         table.add_column("Value", style="white")
 
-        # Determine status color based on status code
-        status_str = str(response.status)
-        if status_str.startswith("2"):
-            status_style = "bold green"
-        elif status_str.startswith("3"):
-            status_style = "bold yellow"
-        elif status_str.startswith("4"):
-            status_style = "bold orange1"
-        else:
-            status_style = "bold red"
-
-        status_text = interpret_status(response.status)
         table.add_row(
             "Status",
-            f"[{status_style}]{response.status}[/] ({status_text})",
+            _STATUS_CELL.format(
+                style=_status_style(response.status),
+                status=response.status,
+                text=interpret_status(response.status),
+            ),
         )
         table.add_row("Meta", response.meta)
 
@@ -71,20 +197,35 @@ def _format_response(response: GeminiResponse, verbose: bool = False) -> None:
         console.print()  # Blank line before body
 
     if response.body:
-        console.print(response.body)
+        # Rich styling only matters for text/gemini; other MIME types and
+        # very large payloads skip Rich's markup/highlight scan and go
+        # straight to stdout.
+        plain = (
+            response.mime_type != "text/gemini"
+            or len(response.body) > _LARGE_BODY_THRESHOLD
+        )
+        if not verbose and plain:
+            # writelines avoids concatenating body + newline into a fresh
+            # string; flushing is left to the caller (or interpreter exit)
+            # so consecutive responses share one buffered flush.
+            if isinstance(response.body, bytes):
+                sys.stdout.buffer.writelines((response.body, b"\n"))
+            else:
+                sys.stdout.writelines((response.body, "\n"))
+        else:
+            console.print(response.body)
     elif not response.is_success():
         # For non-success responses, show the meta as the message
         if not verbose:
-            status_str = str(response.status)
-            if status_str.startswith("3"):
-                console.print(f"[bold yellow][{response.status}][/] {response.meta}")
-            elif status_str.startswith("4"):
-                console.print(f"[bold orange1][{response.status}][/] {response.meta}")
-            else:
-                console.print(f"[bold red][{response.status}][/] {response.meta}")
+            console.print(
+                _ERROR_LINE.format(
+                    style=_status_style(response.status),
+                    status=response.status,
+                    meta=response.meta,
+                )
+            )
 
 
-@app.command()
 def get(
     url: str = typer.Argument(..., help="Gemini URL to get"),
     max_redirects: int = typer.Option(
@@ -172,6 +313,16 @@ def get(
         )
         raise typer.Exit(code=1)
 
+    from .client.session import GeminiClient
+    from .security.tofu import CertificateChangedError
+
+    @_cli_errors(
+        {
+            ValueError: "Error",
+            TimeoutError: "Timeout",
+            ConnectionError: "Connection error",
+        }
+    )
     async def _get() -> None:
         try:
             async with GeminiClient(
@@ -205,42 +356,113 @@ def get(
             error_console.print("\n[cyan]To trust the new certificate, run:[/]")
             error_console.print(f"  nauyaca tofu trust {e.hostname} --port {e.port}")
             raise typer.Exit(code=1) from e
-        except ValueError as e:
-            error_console.print(f"Error: {e}")
-            raise typer.Exit(code=1) from e
-        except TimeoutError as e:
-            error_console.print(f"Timeout: {e}")
-            raise typer.Exit(code=1) from e
-        except ConnectionError as e:
-            error_console.print(f"Connection error: {e}")
-            raise typer.Exit(code=1) from e
-        except Exception as e:
-            error_console.print(f"Unexpected error: {e}")
-            raise typer.Exit(code=1) from e
 
     # Run the async function
-    asyncio.run(_get())
+    _run(_get())
+
+
+def get_many(
+    urls: list[str] = typer.Argument(..., help="Gemini URLs to get"),
+    max_redirects: int = typer.Option(
+        MAX_REDIRECTS,
+        "--max-redirects",
+        "-r",
+        help="Maximum number of redirects to follow",
+    ),
+    no_redirects: bool = typer.Option(
+        False,
+        "--no-redirects",
+        help="Do not follow redirects",
+    ),
+    timeout: float = typer.Option(
+        30.0,
+        "--timeout",
+        "-t",
+        help="Request timeout in seconds",
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Show verbose output with response headers",
+    ),
+    trust_on_first_use: bool = typer.Option(
+        True,
+        "--trust/--no-trust",
+        help="Enable Trust-On-First-Use certificate validation (recommended for Gemini)",
+    ),
+    verify_ssl: bool = typer.Option(
+        False,
+        "--verify-ssl/--no-verify-ssl",
+        help="Use CA-based SSL verification instead of TOFU (not recommended for Gemini)",
+    ),
+) -> None:
+    """Get several Gemini resources over a single shared client.
+
+    All URLs are fetched concurrently through one GeminiClient, so the
+    TLS setup and TOFU database are shared instead of being rebuilt per
+    URL (as a shell loop over `nauyaca get` would do). Responses are
+    displayed in the order the URLs were given.
+
+    Examples:
+
+        # Get several URLs at once
+        $ nauyaca get-many gemini://example.com/ gemini://example.org/
+
+        # Concurrent gets with verbose output
+        $ nauyaca get-many -v gemini://example.com/a gemini://example.com/b
+    """
+    from .client.session import GeminiClient
+
+    @_cli_errors(
+        {
+            ValueError: "Error",
+            OSError: "Connection error",
+        }
+    )
+    async def _get_many() -> None:
+        async with GeminiClient(
+            timeout=timeout,
+            max_redirects=max_redirects,
+            verify_ssl=verify_ssl,
+            trust_on_first_use=trust_on_first_use,
+        ) as client:
+            results = await client.get_many(urls, follow_redirects=not no_redirects)
+
+        failed = False
+        for url, result in zip(urls, results, strict=True):
+            console.print(f"[bold cyan]=== {url} ===[/]")
+            if isinstance(result, BaseException):
+                error_console.print(f"Error: {result}")
+                failed = True
+            else:
+                _format_response(result, verbose=verbose)
+                if result.status >= 40:
+                    failed = True
+
+        # One flush for the whole batch rather than one per response
+        sys.stdout.flush()
+
+        if failed:
+            raise typer.Exit(code=1)
+
+    _run(_get_many())
 
 
-@app.command()
 def serve(
     root: Path | None = typer.Argument(
         None,
         help="Document root directory to serve files from (optional if using --config)",
-        exists=True,
         file_okay=False,
         dir_okay=True,
-        resolve_path=True,
     ),
     config_file: Path | None = typer.Option(
         None,
         "--config",
         "-c",
         help="Path to TOML configuration file (overrides other options)",
-        exists=True,
         file_okay=True,
         dir_okay=False,
-        resolve_path=True,
     ),
     host: str | None = typer.Option(
         None,
@@ -260,19 +482,15 @@ def serve(
         help=(
             "Path to TLS certificate file (optional, generates self-signed if omitted)"
         ),
-        exists=True,
         file_okay=True,
         dir_okay=False,
-        resolve_path=True,
     ),
     key: Path | None = typer.Option(
         None,
         "--key",
         help="Path to TLS private key file (optional)",
-        exists=True,
         file_okay=True,
         dir_okay=False,
-        resolve_path=True,
     ),
     enable_directory_listing: bool = typer.Option(
         False,
@@ -291,7 +509,6 @@ def serve(
         "--log-file",
         help="Path to log file (default: stdout)",
         dir_okay=False,
-        resolve_path=True,
     ),
     json_logs: bool = typer.Option(
         False,
@@ -323,10 +540,8 @@ def serve(
         "--reload-dir",
         help="Directories to watch for changes (can specify multiple times). "
         "Defaults to document_root and src/nauyaca",
-        exists=True,
         file_okay=False,
         dir_okay=True,
-        resolve_path=True,
     ),
     reload_ext: list[str] | None = typer.Option(
         None,
@@ -366,6 +581,30 @@ def serve(
         # Hot-reload with custom watch directories
         $ nauyaca serve ./capsule --reload --reload-dir ./src
     """
+    from .server.config import ServerConfig
+    from .server.server import start_server
+
+    # Resolve and validate paths here rather than at argument-parse time, so
+    # `serve --help` never touches the filesystem.
+    if root is not None:
+        root = root.resolve()
+        if not root.is_dir():
+            error_console.print(
+                f"[red]Error:[/] Document root is not a directory: {root}"
+            )
+            raise typer.Exit(code=1)
+    if config_file is not None:
+        config_file = config_file.resolve()
+        if not config_file.is_file():
+            error_console.print(f"[red]Error:[/] Config file not found: {config_file}")
+            raise typer.Exit(code=1)
+    if cert is not None:
+        cert = cert.resolve()
+    if key is not None:
+        key = key.resolve()
+    if log_file is not None:
+        log_file = log_file.resolve()
+
     # Handle reload mode - runs supervisor that spawns server subprocesses
     if reload:
         # Determine document root for watch directories
@@ -404,8 +643,6 @@ def serve(
             raise typer.Exit(code=1)
 
         # Build server args - filter out reload-related flags
-        import sys
-
         server_args: list[str] = ["serve"]
         skip_next = False
 
@@ -465,6 +702,12 @@ def serve(
 
         return  # Never reached, but makes type checker happy
 
+    @_cli_errors(
+        {
+            ValueError: "Configuration error",
+            OSError: "Server error",
+        }
+    )
     async def _serve() -> None:
         try:
             # Load environment variable overrides (highest priority)
@@ -531,24 +774,14 @@ def serve(
                 max_file_size=max_file_size,
             )
 
-        except ValueError as e:
-            error_console.print(f"Configuration error: {e}")
-            raise typer.Exit(code=1) from e
-        except OSError as e:
-            error_console.print(f"Server error: {e}")
-            raise typer.Exit(code=1) from e
         except KeyboardInterrupt:
             console.print("\n[bold blue][Server][/] Shutting down...")
             raise typer.Exit(code=0) from None
-        except Exception as e:
-            error_console.print(f"Unexpected error: {e}")
-            raise typer.Exit(code=1) from e
 
     # Run the async function
-    asyncio.run(_serve())
+    _run(_serve())
 
 
-@app.command()
 def version() -> None:
     """Show version information."""
     console.print("[bold cyan]Nauyaca[/] Gemini Protocol Client & Server")
@@ -556,15 +789,6 @@ def version() -> None:
     console.print("[bold]Protocol:[/] Gemini (gemini://)")
 
 
-# Create TOFU command group
-tofu_app = typer.Typer(
-    help="Manage TOFU certificate database",
-    no_args_is_help=True,
-)
-app.add_typer(tofu_app, name="tofu")
-
-
-@tofu_app.command("list")
 def tofu_list() -> None:
     """List all known hosts in TOFU database.
 
@@ -573,15 +797,15 @@ def tofu_list() -> None:
         # List all known hosts
         $ nauyaca tofu list
     """
-    from .security.tofu import TOFUDatabase
-
-    db = TOFUDatabase()
+    db = _tofu_db()
     hosts = db.list_hosts()
 
     if not hosts:
         console.print("[yellow]No known hosts in TOFU database.[/]")
         return
 
+    from rich.table import Table
+
     table = Table(title="Known Hosts (TOFU)")
     table.add_column("Hostname", style="cyan")
     table.add_column("Port", justify="right")
@@ -601,7 +825,6 @@ def tofu_list() -> None:
     console.print(table)
 
 
-@tofu_app.command("revoke")
 def tofu_revoke(
     hostname: str = typer.Argument(..., help="Hostname to revoke"),
     port: int | None = typer.Option(
@@ -627,9 +850,7 @@ def tofu_revoke(
         # Revoke a specific port only
         $ nauyaca tofu revoke example.com --port 1965
     """
-    from .security.tofu import TOFUDatabase
-
-    db = TOFUDatabase()
+    db = _tofu_db()
 
     if port is not None:
         # Specific port: revoke single entry (no confirmation needed)
@@ -655,7 +876,6 @@ def tofu_revoke(
         console.print(f"[green]Revoked {deleted} entries for {hostname}[/]")
 
 
-@tofu_app.command("trust")
 def tofu_trust(
     hostname: str = typer.Argument(..., help="Hostname to trust"),
     port: int = typer.Option(DEFAULT_PORT, "--port", "-p", help="Port number"),
@@ -676,7 +896,7 @@ def tofu_trust(
         # Trust with custom port
         $ nauyaca tofu trust example.com --port 1965
     """
-    from .security.tofu import TOFUDatabase
+    from .client.session import GeminiClient
 
     async def _trust() -> None:
         try:
@@ -687,48 +907,26 @@ def tofu_trust(
                 verify_ssl=False,
                 trust_on_first_use=False,
             ) as client:
-                # Create connection to get certificate
-                url = f"gemini://{hostname}:{port}/"
-                loop = asyncio.get_running_loop()
-                response_future: asyncio.Future = loop.create_future()
-
-                from .client.protocol import GeminiClientProtocol
-
-                protocol = GeminiClientProtocol(url, response_future)
+                cert = await client.peek_certificate(hostname, port)
 
-                transport, protocol = await loop.create_connection(
-                    lambda: protocol,
-                    host=hostname,
-                    port=port,
-                    ssl=client.ssl_context,
-                    server_hostname=hostname,
-                )
-
-                try:
-                    cert = protocol.get_peer_certificate()
-                    if cert:
-                        # Add to TOFU database
-                        db = TOFUDatabase()
-                        db.trust(hostname, port, cert)
-                        console.print(
-                            f"[green]Certificate trusted for {hostname}:{port}[/]"
-                        )
-                    else:
-                        error_console.print(
-                            "[red]Error: Could not retrieve certificate[/]"
-                        )
-                        raise typer.Exit(code=1)
-                finally:
-                    transport.close()
+            if cert:
+                # Add to TOFU database
+                db = _tofu_db()
+                db.trust(hostname, port, cert)
+                console.print(f"[green]Certificate trusted for {hostname}:{port}[/]")
+            else:
+                error_console.print("[red]Error: Could not retrieve certificate[/]")
+                raise typer.Exit(code=1)
 
+        except typer.Exit:
+            raise
         except Exception as e:
             error_console.print(f"[red]Error: {e}[/]")
             raise typer.Exit(code=1) from e
 
-    asyncio.run(_trust())
+    _run(_trust())
 
 
-@tofu_app.command("clear")
 def tofu_clear(
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation prompt"),
 ) -> None:
@@ -742,19 +940,16 @@ def tofu_clear(
         # Clear without confirmation
         $ nauyaca tofu clear --force
     """
-    from .security.tofu import TOFUDatabase
-
     if not force:
         confirm = typer.confirm("Clear all known hosts from TOFU database?")
         if not confirm:
             raise typer.Abort()
 
-    db = TOFUDatabase()
+    db = _tofu_db()
     count = db.clear()
     console.print(f"[green]Cleared {count} entries from TOFU database[/]")
 
 
-@tofu_app.command("info")
 def tofu_info(
     hostname: str = typer.Argument(..., help="Hostname to inspect"),
     port: int = typer.Option(DEFAULT_PORT, "--port", "-p", help="Port number"),
@@ -769,15 +964,15 @@ def tofu_info(
         # Show info with custom port
         $ nauyaca tofu info example.com --port 1965
     """
-    from .security.tofu import TOFUDatabase
-
-    db = TOFUDatabase()
+    db = _tofu_db()
     info = db.get_host_info(hostname, port)
 
     if info is None:
         console.print(f"[yellow]Host {hostname}:{port} not in database[/]")
         raise typer.Exit(code=1)
 
+    from rich.table import Table
+
     table = Table(show_header=False, box=None)
     table.add_column("Key", style="bold cyan")
     table.add_column("Value")
@@ -791,7 +986,6 @@ def tofu_info(
     console.print(table)
 
 
-@tofu_app.command("export")
 def tofu_export(
     file: Path = typer.Argument(..., help="Output TOML file path"),
     force: bool = typer.Option(False, "--force", "-f", help="Overwrite existing file"),
@@ -809,8 +1003,6 @@ def tofu_export(
         # Overwrite existing file
         $ nauyaca tofu export backup.toml --force
     """
-    from .security.tofu import TOFUDatabase
-
     # Check if file exists
     if file.exists() and not force:
         error_console.print(
@@ -819,7 +1011,7 @@ def tofu_export(
         raise typer.Exit(code=1)
 
     try:
-        db = TOFUDatabase()
+        db = _tofu_db()
         count = db.export_toml(file)
         console.print(f"[green]Exported {count} hosts to {file}[/]")
     except Exception as e:
@@ -827,7 +1019,6 @@ def tofu_export(
         raise typer.Exit(code=1) from e
 
 
-@tofu_app.command("import")
 def tofu_import(
     file: Path = typer.Argument(
         ..., help="Input TOML file path", exists=True, file_okay=True, dir_okay=False
@@ -856,8 +1047,6 @@ def tofu_import(
         # Auto-accept all conflicts
         $ nauyaca tofu import backup.toml --force
     """
-    from .security.tofu import TOFUDatabase
-
     # Confirm replace mode if not forced
     if replace and not force:
         confirm = typer.confirm(
@@ -876,6 +1065,8 @@ def tofu_import(
         # Show conflict to user
         console.print(f"\n[bold yellow]Fingerprint conflict for {hostname}:{port}[/]")
 
+        from rich.table import Table
+
         conflict_table = Table(show_header=True, box=None)
         conflict_table.add_column("Source", style="bold")
         conflict_table.add_column("Fingerprint")
@@ -890,7 +1081,7 @@ def tofu_import(
         return accept
 
     try:
-        db = TOFUDatabase()
+        db = _tofu_db()
         added, updated, skipped = db.import_toml(
             file, merge=not replace, on_conflict=conflict_handler
         )
@@ -898,6 +1089,8 @@ def tofu_import(
         # Show summary
         console.print("\n[bold green]Import complete![/]")
 
+        from rich.table import Table
+
         summary_table = Table(show_header=False, box=None)
         summary_table.add_column("Metric", style="bold cyan")
         summary_table.add_column("Count", justify="right")
@@ -919,15 +1112,6 @@ def tofu_import(
         raise typer.Exit(code=1) from e
 
 
-# Create cert command group
-cert_app = typer.Typer(
-    help="Manage client certificates for authentication",
-    no_args_is_help=True,
-)
-app.add_typer(cert_app, name="cert")
-
-
-@cert_app.command("generate")
 def cert_generate(
     name: str = typer.Argument(..., help="Name for the certificate (used in filename)"),
     output_dir: Path | None = typer.Option(
@@ -1036,6 +1220,8 @@ def cert_generate(
         # Display results
         console.print("\n[bold green]Certificate generated successfully![/]\n")
 
+        from rich.table import Table
+
         table = Table(show_header=False, box=None)
         table.add_column("Key", style="bold cyan")
         table.add_column("Value")
@@ -1057,7 +1243,6 @@ def cert_generate(
         raise typer.Exit(code=1) from e
 
 
-@cert_app.command("info")
 def cert_info(
     cert_file: Path = typer.Argument(
         ...,
@@ -1085,6 +1270,8 @@ def cert_info(
         info = get_certificate_info(cert)
         fingerprint = get_certificate_fingerprint(cert)
 
+        from rich.table import Table
+
         table = Table(show_header=False, box=None)
         table.add_column("Key", style="bold cyan")
         table.add_column("Value")
@@ -1103,9 +1290,72 @@ def cert_info(
         raise typer.Exit(code=1) from e
 
 
+def _build_app() -> typer.Typer:
+    """Build the Typer application and register all commands.
+
+    Command registration walks every command signature to construct Click
+    parameter objects, so it is deferred until the app is actually needed
+    (via ``main()`` or the module's ``app`` attribute) rather than run at
+    import time.
+    """
+    app = typer.Typer(
+        name="nauyaca",
+        help="Nauyaca - A modern Gemini protocol client",
+        add_completion=True,
+        no_args_is_help=True,
+    )
+    app.command()(get)
+    app.command("get-many")(get_many)
+    app.command()(serve)
+    app.command()(version)
+
+    # TOFU command group
+    tofu_app = typer.Typer(
+        help="Manage TOFU certificate database",
+        no_args_is_help=True,
+    )
+    tofu_app.command("list")(tofu_list)
+    tofu_app.command("revoke")(tofu_revoke)
+    tofu_app.command("trust")(tofu_trust)
+    tofu_app.command("clear")(tofu_clear)
+    tofu_app.command("info")(tofu_info)
+    tofu_app.command("export")(tofu_export)
+    tofu_app.command("import")(tofu_import)
+    app.add_typer(tofu_app, name="tofu")
+
+    # Cert command group
+    cert_app = typer.Typer(
+        help="Manage client certificates for authentication",
+        no_args_is_help=True,
+    )
+    cert_app.command("generate")(cert_generate)
+    cert_app.command("info")(cert_info)
+    app.add_typer(cert_app, name="cert")
+
+    return app
+
+
+def __getattr__(name: str) -> typer.Typer:
+    """Materialize the Typer ``app`` lazily on first attribute access (PEP 562)."""
+    if name == "app":
+        app = _build_app()
+        globals()["app"] = app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def main() -> None:
     """Main entry point for the CLI."""
-    app()
+    # Fast path: print version info without dispatching through Typer.
+    if len(sys.argv) == 2 and sys.argv[1] == "version":
+        sys.stdout.write(
+            "Nauyaca Gemini Protocol Client & Server\n"
+            f"Version: {get_version('nauyaca')}\n"
+            "Protocol: Gemini (gemini://)\n"
+        )
+        return
+
+    _build_app()()
 
 
 if __name__ == "__main__":
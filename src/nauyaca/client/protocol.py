@@ -5,12 +5,43 @@ Protocol/Transport pattern for efficient, non-blocking I/O.
 """
 
 import asyncio
+import codecs
+import sys
 
 from cryptography import x509
 
 from ..protocol.constants import CRLF, MAX_RESPONSE_BODY_SIZE
 from ..protocol.response import GeminiResponse
 
+# Real workloads see the same handful of header lines ("20 text/gemini",
+# "31 gemini://...") on every request; cache the decoded form keyed by the
+# raw bytes so repeat headers skip the UTF-8 decode. FIFO-evicted at a
+# small cap so hostile servers can't grow it without bound.
+_HEADER_CACHE: dict[bytes, str] = {}
+_HEADER_CACHE_MAX = 256
+
+
+def _decode_header_line(raw: bytes) -> str:
+    """Decode a response header line, memoizing recurring lines.
+
+    Args:
+        raw: The raw header line bytes (without CRLF).
+
+    Returns:
+        The decoded (and interned) header line.
+
+    Raises:
+        UnicodeDecodeError: If the line is not valid UTF-8.
+    """
+    cached = _HEADER_CACHE.get(raw)
+    if cached is not None:
+        return cached
+    decoded = sys.intern(raw.decode("utf-8"))
+    if len(_HEADER_CACHE) >= _HEADER_CACHE_MAX:
+        _HEADER_CACHE.pop(next(iter(_HEADER_CACHE)))
+    _HEADER_CACHE[raw] = decoded
+    return decoded
+
 
 class GeminiClientProtocol(asyncio.Protocol):
     """Client-side protocol for making Gemini requests.
@@ -44,11 +75,25 @@ class GeminiClientProtocol(asyncio.Protocol):
         """
         self.url = url
         self.response_future = response_future
+        # Encode the request line up front so connection_made, which runs
+        # on the event-loop callback path, only has to write bytes
+        self._request_line = f"{url}\r\n".encode()
         self.transport: asyncio.Transport | None = None
-        self.buffer = b""
+        self.buffer = bytearray()
+        # Bookmark for the CRLF scan: bytes before this offset have already
+        # been searched, so fragmented headers don't rescan from the start.
+        self._crlf_search_start = 0
         self.header_received = False
         self.status: int | None = None
         self.meta: str | None = None
+        # Text bodies are decoded incrementally as chunks arrive; binary
+        # bodies accumulate in self.buffer instead.
+        self._body_decoder: codecs.IncrementalDecoder | None = None
+        self._body_parts: list[str] = []
+        self._body_len = 0
+        # Last DER certificate parsed by get_peer_certificate, so repeated
+        # lookups (TOFU check, fingerprinting, logging) skip the ASN.1 parse
+        self._peer_cert_cache: tuple[bytes, x509.Certificate] | None = None
 
     def connection_made(self, transport: asyncio.BaseTransport) -> None:
         """Called when connection to server is established.
@@ -60,10 +105,9 @@ class GeminiClientProtocol(asyncio.Protocol):
         """
         self.transport = transport  # type: ignore[assignment]
 
-        # Send Gemini request (just the URL + CRLF)
-        request = f"{self.url}\r\n"
+        # Send Gemini request (just the URL + CRLF, encoded at construction)
         if self.transport:
-            self.transport.write(request.encode("utf-8"))
+            self.transport.write(self._request_line)
 
     def data_received(self, data: bytes) -> None:
         """Called when data is received from the server.
@@ -74,33 +118,109 @@ class GeminiClientProtocol(asyncio.Protocol):
         Args:
             data: Raw bytes received from the server.
         """
-        self.buffer += data
-
-        # Check if we've received the complete header
-        if not self.header_received and CRLF in self.buffer:
-            header_line, body = self.buffer.split(CRLF, 1)
-            self._parse_header(header_line.decode("utf-8"))
-            self.buffer = body
-            self.header_received = True
+        if self.header_received:
+            self._receive_body(data)
+            return
 
-            # If parsing failed, close immediately
-            if self.status is None:
+        self.buffer.extend(data)
+
+        # Check if we've received the complete header. Resume the CRLF scan
+        # one byte before the bookmark in case CR and LF straddled chunks.
+        crlf_index = self.buffer.find(CRLF, max(0, self._crlf_search_start - 1))
+        if crlf_index < 0:
+            self._crlf_search_start = len(self.buffer)
+            # Check if we've received too much data (prevent memory exhaustion)
+            if len(self.buffer) > MAX_RESPONSE_BODY_SIZE:
+                self._set_error(
+                    Exception(
+                        f"Response body exceeds maximum size "
+                        f"({MAX_RESPONSE_BODY_SIZE} bytes)"
+                    )
+                )
                 self.transport.close()  # type: ignore
-                return
+            return
 
-            # If status is not success (20-29), close immediately
-            # (no body expected for non-success responses)
-            if not (20 <= self.status < 30):
-                self.transport.close()  # type: ignore
+        header_line = bytes(self.buffer[:crlf_index])
+        del self.buffer[: crlf_index + len(CRLF)]
+        self._parse_header(_decode_header_line(header_line))
+        self.header_received = True
 
-        # Check if we've received too much data (prevent memory exhaustion)
-        if len(self.buffer) > MAX_RESPONSE_BODY_SIZE:
+        # If parsing failed, close immediately
+        if self.status is None:
+            self.transport.close()  # type: ignore
+            return
+
+        # If status is not success (20-29), close immediately
+        # (no body expected for non-success responses)
+        if not (20 <= self.status < 30):
+            self.transport.close()  # type: ignore
+            return
+
+        # Body bytes may have arrived together with the header
+        self._setup_body_decoder()
+        if self.buffer:
+            leftover = bytes(self.buffer)
+            self.buffer.clear()
+            self._receive_body(leftover)
+
+    def _setup_body_decoder(self) -> None:
+        """Create an incremental decoder for text bodies.
+
+        Examines the response meta to decide whether the body is text and,
+        if so, which charset to use. Binary bodies get no decoder and are
+        accumulated as raw bytes instead.
+        """
+        # Check if this is text content by examining MIME type
+        mime_type = (self.meta or "").split(";")[0].strip().lower()
+        is_text = mime_type.startswith("text/") or mime_type == ""
+        if not is_text:
+            return
+
+        # Get charset from meta if specified, default to utf-8
+        charset = "utf-8"
+        # Parse charset from meta (e.g., "text/gemini; charset=iso-8859-1")
+        if "charset=" in (self.meta or "").lower():
+            for part in (self.meta or "").split(";"):
+                part = part.strip()
+                if part.lower().startswith("charset="):
+                    charset = part.split("=", 1)[1].strip().strip("\"'")
+                    break
+        self._body_decoder = codecs.getincrementaldecoder(charset)()
+
+    def _receive_body(self, data: bytes) -> None:
+        """Accumulate a body chunk, decoding text content incrementally.
+
+        Decoding chunk-by-chunk keeps peak memory at roughly one copy of
+        the body and surfaces invalid byte sequences on the offending
+        chunk instead of at connection close.
+
+        Args:
+            data: Raw body bytes received from the server.
+        """
+        # Check capacity before appending so an oversized response is
+        # rejected without the oversized buffer ever being allocated
+        if len(data) > MAX_RESPONSE_BODY_SIZE - self._body_len:
             self._set_error(
                 Exception(
                     f"Response body exceeds maximum size ({MAX_RESPONSE_BODY_SIZE} bytes)"
                 )
             )
             self.transport.close()  # type: ignore
+            return
+        self._body_len += len(data)
+
+        if self._body_decoder is None:
+            self.buffer.extend(data)
+            return
+
+        try:
+            text = self._body_decoder.decode(data)
+        except UnicodeDecodeError as e:
+            self._set_error(e)
+            self.transport.close()  # type: ignore
+            return
+        if text:
+            self._body_parts.append(text)
 
     def _parse_header(self, header_line: str) -> None:
         """Parse the Gemini response header.
@@ -116,11 +236,23 @@ class GeminiClientProtocol(asyncio.Protocol):
             self._set_error(ValueError("Invalid response header: missing status"))
             return
 
-        try:
-            self.status = int(parts[0])
-        except ValueError:
-            self._set_error(ValueError(f"Invalid status code: {parts[0]}"))
-            return
+        token = parts[0]
+        if len(token) == 2:
+            # Fast path: a well-formed status is exactly two ASCII digits,
+            # so digit arithmetic avoids the general-purpose int() parser.
+            d0 = ord(token[0]) - 0x30
+            d1 = ord(token[1]) - 0x30
+            if 0 <= d0 <= 9 and 0 <= d1 <= 9:
+                self.status = d0 * 10 + d1
+            else:
+                self._set_error(ValueError(f"Invalid status code: {token}"))
+                return
+        else:
+            try:
+                self.status = int(token)
+            except ValueError:
+                self._set_error(ValueError(f"Invalid status code: {token}"))
+                return
 
         # Meta is optional, default to empty string
         self.meta = parts[1] if len(parts) > 1 else ""
@@ -162,31 +294,23 @@ class GeminiClientProtocol(asyncio.Protocol):
             )
             return
 
-        # Decode body (only present for 2x success responses)
+        # Assemble body (only present for 2x success responses)
         body: str | bytes | None = None
         if 20 <= self.status < 30:  # type: ignore
-            # Check if this is text content by examining MIME type
-            mime_type = (self.meta or "").split(";")[0].strip().lower()
-            is_text = mime_type.startswith("text/") or mime_type == ""
-
-            if is_text:
-                # Get charset from meta if specified, default to utf-8
-                charset = "utf-8"
-                # Parse charset from meta (e.g., "text/gemini; charset=iso-8859-1")
-                if "charset=" in (self.meta or "").lower():
-                    for part in (self.meta or "").split(";"):
-                        part = part.strip()
-                        if part.lower().startswith("charset="):
-                            charset = part.split("=", 1)[1].strip().strip("\"'")
-                            break
+            if self._body_decoder is not None:
+                # Flush the decoder so a truncated multi-byte sequence at
+                # the end of the body is reported, as a full decode would
                 try:
-                    body = self.buffer.decode(charset)
+                    tail = self._body_decoder.decode(b"", final=True)
                 except UnicodeDecodeError as e:
                     self.response_future.set_exception(e)
                     return
+                if tail:
+                    self._body_parts.append(tail)
+                body = "".join(self._body_parts)
             else:
                 # Binary content - return raw bytes
-                body = self.buffer
+                body = bytes(self.buffer)
 
         # Create and set the response
         response = GeminiResponse(
@@ -225,7 +349,14 @@ class GeminiClientProtocol(asyncio.Protocol):
             # Note: binary_form=True returns the certificate as DER-encoded bytes
             der_cert = ssl_object.getpeercert(binary_form=True)
             if der_cert:
-                return x509.load_der_x509_certificate(der_cert)
+                # A bytes compare is far cheaper than re-parsing the ASN.1
+                # structure, and the peer certificate can't change mid-connection
+                cached = self._peer_cert_cache
+                if cached is not None and cached[0] == der_cert:
+                    return cached[1]
+                cert = x509.load_der_x509_certificate(der_cert)
+                self._peer_cert_cache = (der_cert, cert)
+                return cert
         except Exception:
             # If we can't load the certificate, return None
             return None
@@ -275,7 +406,9 @@ class TitanClientProtocol(asyncio.Protocol):
         self.content = content
         self.response_future = response_future
         self.transport: asyncio.Transport | None = None
-        self.buffer = b""
+        self.buffer = bytearray()
+        # Bookmark for the CRLF scan, as in GeminiClientProtocol
+        self._crlf_search_start = 0
         self.header_received = False
         self.status: int | None = None
         self.meta: str | None = None
@@ -304,25 +437,30 @@ class TitanClientProtocol(asyncio.Protocol):
         Args:
             data: Raw bytes received from the server.
         """
-        self.buffer += data
-
-        # Check if we've received the complete header
-        if not self.header_received and CRLF in self.buffer:
-            header_line, body = self.buffer.split(CRLF, 1)
-            self._parse_header(header_line.decode("utf-8"))
-            self.buffer = body
-            self.header_received = True
-
-            # If parsing failed, close immediately
-            if self.status is None:
-                if self.transport:
-                    self.transport.close()
-                return
+        self.buffer.extend(data)
+
+        # Check if we've received the complete header. Resume the CRLF scan
+        # one byte before the bookmark in case CR and LF straddled chunks.
+        if not self.header_received:
+            crlf_index = self.buffer.find(CRLF, max(0, self._crlf_search_start - 1))
+            if crlf_index < 0:
+                self._crlf_search_start = len(self.buffer)
+            else:
+                header_line = bytes(self.buffer[:crlf_index])
+                del self.buffer[: crlf_index + len(CRLF)]
+                self._parse_header(_decode_header_line(header_line))
+                self.header_received = True
+
+                # If parsing failed, close immediately
+                if self.status is None:
+                    if self.transport:
+                        self.transport.close()
+                    return
 
-            # If status is not success (20-29), close immediately
-            if not (20 <= self.status < 30):
-                if self.transport:
-                    self.transport.close()
+                # If status is not success (20-29), close immediately
+                if not (20 <= self.status < 30):
+                    if self.transport:
+                        self.transport.close()
 
         # Check if we've received too much data
         if len(self.buffer) > MAX_RESPONSE_BODY_SIZE:
@@ -406,7 +544,7 @@ class TitanClientProtocol(asyncio.Protocol):
                     self.response_future.set_exception(e)
                     return
             else:
-                body = self.buffer
+                body = bytes(self.buffer)
 
         response = GeminiResponse(
             status=self.status,  # type: ignore
@@ -6,9 +6,12 @@ Gemini requests, built on top of the low-level GeminiClientProtocol.
 
 import asyncio
 import ssl
+from functools import lru_cache
 from pathlib import Path
 
-from ..protocol.constants import MAX_REDIRECTS
+from cryptography import x509
+
+from ..protocol.constants import DEFAULT_PORT, MAX_REDIRECTS
 from ..protocol.response import GeminiResponse
 from ..protocol.status import is_redirect
 from ..security.certificates import get_certificate_fingerprint
@@ -17,6 +20,48 @@ from ..security.tofu import CertificateChangedError, TOFUDatabase
 from ..utils.url import parse_url, validate_url
 from .protocol import GeminiClientProtocol, TitanClientProtocol
 
+# Scheme prefixes checked on the redirect and upload paths
+_GEMINI_SCHEME = "gemini://"
+_TITAN_SCHEME = "titan://"
+
+
+@lru_cache(maxsize=8)
+def _default_client_context(
+    verify_ssl: bool,
+    certfile: str | None,
+    keyfile: str | None,
+) -> ssl.SSLContext:
+    """Build the default client SSL context, memoized by its settings.
+
+    Context creation loads the trust store, which dominates the cost of
+    constructing a GeminiClient; clients created with the same settings
+    share one context. Callers passing their own context bypass this.
+
+    Args:
+        verify_ssl: Whether to verify certificates via CA validation.
+        certfile: Optional path to a client certificate file.
+        keyfile: Optional path to a client private key file.
+
+    Returns:
+        An SSL context configured for Gemini client connections.
+    """
+    if verify_ssl:
+        # CA-based verification (not recommended for Gemini)
+        return create_client_context(
+            verify_mode=ssl.CERT_REQUIRED,
+            check_hostname=True,
+            certfile=certfile,
+            keyfile=keyfile,
+        )
+    # TOFU mode or testing mode - accept all certificates
+    # TOFU validation happens after connection is established
+    return create_client_context(
+        verify_mode=ssl.CERT_NONE,
+        check_hostname=False,
+        certfile=certfile,
+        keyfile=keyfile,
+    )
+
 
 class GeminiClient:
     """High-level Gemini client with async/await API.
@@ -87,25 +132,14 @@ class GeminiClient:
         else:
             self.tofu_db = None
 
-        # Create SSL context if not provided
+        # Create SSL context if not provided (shared across clients with
+        # the same settings; see _default_client_context)
         if ssl_context is None:
-            if verify_ssl:
-                # CA-based verification (not recommended for Gemini)
-                self.ssl_context = create_client_context(
-                    verify_mode=ssl.CERT_REQUIRED,
-                    check_hostname=True,
-                    certfile=str(client_cert) if client_cert else None,
-                    keyfile=str(client_key) if client_key else None,
-                )
-            else:
-                # TOFU mode or testing mode - accept all certificates
-                # TOFU validation happens after connection is established
-                self.ssl_context = create_client_context(
-                    verify_mode=ssl.CERT_NONE,
-                    check_hostname=False,
-                    certfile=str(client_cert) if client_cert else None,
-                    keyfile=str(client_key) if client_key else None,
-                )
+            self.ssl_context = _default_client_context(
+                verify_ssl,
+                str(client_cert) if client_cert else None,
+                str(client_key) if client_key else None,
+            )
         else:
             self.ssl_context = ssl_context
 
@@ -120,7 +154,8 @@ class GeminiClient:
         exc_tb: object,
     ) -> None:
         """Async context manager exit."""
-        pass
+        if self.tofu_db:
+            self.tofu_db.close()
 
     async def get(
         self,
@@ -156,6 +191,47 @@ class GeminiClient:
         else:
             return await self._get_single(url)
 
+    async def get_many(
+        self,
+        urls: list[str],
+        concurrency: int = 16,
+        follow_redirects: bool = True,
+    ) -> list[GeminiResponse | BaseException]:
+        """Get multiple Gemini resources concurrently.
+
+        Fetches run in parallel, bounded by a semaphore so a large URL list
+        does not open unbounded connections. Failures do not abort the batch:
+        the exception is returned in the failed URL's slot.
+
+        Args:
+            urls: The Gemini URLs to get.
+            concurrency: Maximum number of in-flight requests. Default is 16.
+            follow_redirects: Whether to automatically follow redirects.
+                Default is True.
+
+        Returns:
+            A list with one entry per URL, in input order: a GeminiResponse
+            on success or the raised exception on failure.
+
+        Examples:
+            >>> results = await client.get_many([
+            ...     'gemini://example.com/',
+            ...     'gemini://example.org/',
+            ... ])
+            >>> for result in results:
+            ...     if isinstance(result, GeminiResponse):
+            ...         print(result.status)
+        """
+        semaphore = asyncio.BoundedSemaphore(concurrency)
+
+        async def bounded_get(url: str) -> GeminiResponse:
+            async with semaphore:
+                return await self.get(url, follow_redirects=follow_redirects)
+
+        return await asyncio.gather(
+            *(bounded_get(url) for url in urls), return_exceptions=True
+        )
+
     async def _get_single(self, url: str) -> GeminiResponse:
         """Get a single URL without following redirects.
 
@@ -183,24 +259,28 @@ class GeminiClient:
         # Per spec: "client SHOULD add trailing '/' for empty paths"
         protocol = GeminiClientProtocol(parsed.normalized, response_future)
 
-        # Create connection using Protocol/Transport pattern
-        try:
-            transport, protocol = await asyncio.wait_for(
-                loop.create_connection(
+        # One wait_for wraps the whole exchange so a single timer is
+        # scheduled per request instead of one per phase; `connected`
+        # distinguishes the two timeout messages.
+        transport: asyncio.Transport | None = None
+        connected = False
+
+        async def connect_and_read() -> GeminiResponse:
+            nonlocal transport, connected
+
+            # Create connection using Protocol/Transport pattern
+            try:
+                transport, _ = await loop.create_connection(
                     lambda: protocol,
                     host=parsed.hostname,
                     port=parsed.port,
                     ssl=self.ssl_context,
                     server_hostname=parsed.hostname,
-                ),
-                timeout=self.timeout,
-            )
-        except TimeoutError as e:
-            raise TimeoutError(f"Connection timeout: {url}") from e
-        except OSError as e:
-            raise ConnectionError(f"Connection failed: {e}") from e
+                )
+            except OSError as e:
+                raise ConnectionError(f"Connection failed: {e}") from e
+            connected = True
 
-        try:
             # If TOFU is enabled, verify the certificate
             if self.tofu_db:
                 cert = protocol.get_peer_certificate()
@@ -228,29 +308,34 @@ class GeminiClient:
                         # First time seeing this host - trust it
                         self.tofu_db.trust(parsed.hostname, parsed.port, cert)
 
-            # Wait for response with timeout
-            response: GeminiResponse = await asyncio.wait_for(
-                response_future, timeout=self.timeout
-            )
+            response: GeminiResponse = await response_future
             return response
+
+        try:
+            return await asyncio.wait_for(connect_and_read(), timeout=self.timeout)
         except TimeoutError as e:
-            raise TimeoutError(f"Request timeout: {url}") from e
+            if connected:
+                raise TimeoutError(f"Request timeout: {url}") from e
+            raise TimeoutError(f"Connection timeout: {url}") from e
         finally:
             # Ensure transport is closed
-            transport.close()
+            if transport is not None:
+                transport.close()
 
     async def _get_with_redirects(
         self,
         url: str,
         max_redirects: int,
-        redirect_chain: list | None = None,
     ) -> GeminiResponse:
         """Get a URL and follow redirects.
 
+        Redirects are followed iteratively, with a set of visited URLs for
+        O(1) loop detection, rather than recursing one coroutine frame per
+        hop.
+
         Args:
             url: The Gemini URL to get.
             max_redirects: Maximum number of redirects to follow.
-            redirect_chain: List of URLs already visited (for loop detection).
 
         Returns:
             A GeminiResponse object (final response after all redirects).
@@ -260,41 +345,93 @@ class GeminiClient:
             asyncio.TimeoutError: If the request times out.
             ConnectionError: If the connection fails.
         """
-        if redirect_chain is None:
-            redirect_chain = []
-
-        # Check for redirect loop
-        if url in redirect_chain:
-            raise ValueError(f"Redirect loop detected: {url}")
+        visited: set[str] = set()
+        current = url
+
+        while True:
+            # Check for redirect loop
+            if current in visited:
+                raise ValueError(f"Redirect loop detected: {current}")
+
+            # Check max redirects
+            if len(visited) >= max_redirects:
+                raise ValueError(
+                    f"Maximum redirects ({max_redirects}) exceeded at: {current}"
+                )
 
-        # Check max redirects
-        if len(redirect_chain) >= max_redirects:
-            raise ValueError(f"Maximum redirects ({max_redirects}) exceeded at: {url}")
+            # Get the URL
+            response = await self._get_single(current)
 
-        # Get the URL
-        response = await self._get_single(url)
+            # Not a redirect, return the response
+            if not is_redirect(response.status):
+                return response
 
-        # If it's a redirect, follow it
-        if is_redirect(response.status):
             redirect_url = response.redirect_url
             if not redirect_url:
                 raise ValueError(f"Redirect response missing URL: {response.meta}")
 
             # Only follow gemini:// redirects (per Gemini best practices)
             # Return non-gemini redirects as-is, letting caller decide
-            if not redirect_url.startswith("gemini://"):
+            if not redirect_url.startswith(_GEMINI_SCHEME):
                 return response
 
-            # Add current URL to chain and follow redirect
-            redirect_chain.append(url)
-            return await self._get_with_redirects(
-                redirect_url,
-                max_redirects=max_redirects,
-                redirect_chain=redirect_chain,
+            # Mark current URL visited and follow the redirect
+            visited.add(current)
+            current = redirect_url
+
+    async def peek_certificate(
+        self,
+        hostname: str,
+        port: int = DEFAULT_PORT,
+    ) -> x509.Certificate | None:
+        """Connect to a host and return its TLS certificate.
+
+        The connection is held only long enough to complete the TLS
+        handshake and extract the peer certificate; the response (if any)
+        is never awaited. This is what `nauyaca tofu trust` uses to grab
+        a certificate without issuing a full request cycle.
+
+        Args:
+            hostname: Server hostname to connect to.
+            port: Server port. Default is 1965.
+
+        Returns:
+            The server's certificate, or None if it could not be retrieved.
+
+        Raises:
+            asyncio.TimeoutError: If the connection times out.
+            ConnectionError: If the connection fails.
+        """
+        url = f"gemini://{hostname}:{port}/"
+
+        # Get event loop
+        loop = asyncio.get_running_loop()
+
+        # Create future for response (never awaited; required by protocol)
+        response_future: asyncio.Future = loop.create_future()
+
+        protocol = GeminiClientProtocol(url, response_future)
+
+        try:
+            transport, protocol = await asyncio.wait_for(
+                loop.create_connection(
+                    lambda: protocol,
+                    host=hostname,
+                    port=port,
+                    ssl=self.ssl_context,
+                    server_hostname=hostname,
+                ),
+                timeout=self.timeout,
             )
+        except TimeoutError as e:
+            raise TimeoutError(f"Connection timeout: {url}") from e
+        except OSError as e:
+            raise ConnectionError(f"Connection failed: {e}") from e
 
-        # Not a redirect, return the response
-        return response
+        try:
+            return protocol.get_peer_certificate()
+        finally:
+            transport.close()
 
     async def upload(
         self,
@@ -353,9 +490,9 @@ class GeminiClient:
             content_bytes = content
 
         # Convert gemini:// to titan:// if needed
-        if url.startswith("gemini://"):
-            titan_url_base = "titan://" + url[9:]
-        elif url.startswith("titan://"):
+        if url.startswith(_GEMINI_SCHEME):
+            titan_url_base = _TITAN_SCHEME + url[len(_GEMINI_SCHEME) :]
+        elif url.startswith(_TITAN_SCHEME):
             titan_url_base = url
         else:
             raise ValueError("URL must use gemini:// or titan:// scheme")
@@ -5,6 +5,7 @@ Gemini protocol responses.
 """
 
 from dataclasses import dataclass
+from functools import cached_property
 
 from .status import is_redirect, is_success
 
@@ -49,9 +50,23 @@ class GeminiResponse:
         """Check if this response indicates a redirect (3x status code)."""
         return is_redirect(self.status)
 
-    @property
+    @cached_property
+    def body_bytes(self) -> bytes | None:
+        """Get the body encoded as bytes, memoized on first access.
+
+        Returns:
+            The UTF-8 encoded body for text bodies, raw bytes for binary
+            bodies, or None if there is no body.
+        """
+        if self.body is None:
+            return None
+        if isinstance(self.body, bytes):
+            return self.body
+        return self.body.encode("utf-8")
+
+    @cached_property
     def mime_type(self) -> str | None:
-        """Get the MIME type from a success response.
+        """Get the MIME type from a success response, memoized on first access.
 
         Returns:
             The MIME type if this is a success response, None otherwise.
@@ -73,10 +88,13 @@ class GeminiResponse:
             return self.meta
         return None
 
-    @property
+    @cached_property
     def charset(self) -> str:
         """Extract charset from MIME type parameters, defaulting to utf-8.
 
+        Memoized on first access; redirects and errors that never consult
+        it pay nothing.
+
         Returns:
             The charset specified in the meta field, or 'utf-8' if not specified.
         """
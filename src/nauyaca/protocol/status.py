@@ -75,6 +75,17 @@ class StatusCode(IntEnum):
     """Certificate not valid (expired, wrong domain, etc.)."""
 
 
+# Category names keyed by the first digit of the status code
+_STATUS_CATEGORIES = {
+    1: "INPUT",
+    2: "SUCCESS",
+    3: "REDIRECT",
+    4: "TEMPORARY FAILURE",
+    5: "PERMANENT FAILURE",
+    6: "CLIENT CERTIFICATE REQUIRED",
+}
+
+
 def interpret_status(status: int) -> str:
     """Interpret a status code and return its category name.
 
@@ -92,20 +103,18 @@ def interpret_status(status: int) -> str:
         >>> interpret_status(30)
         'REDIRECT'
     """
-    if 10 <= status < 20:
-        return "INPUT"
-    elif 20 <= status < 30:
-        return "SUCCESS"
-    elif 30 <= status < 40:
-        return "REDIRECT"
-    elif 40 <= status < 50:
-        return "TEMPORARY FAILURE"
-    elif 50 <= status < 60:
-        return "PERMANENT FAILURE"
-    elif 60 <= status < 70:
-        return "CLIENT CERTIFICATE REQUIRED"
-    else:
-        return "UNKNOWN"
+    if 10 <= status < 70:
+        return _STATUS_CATEGORIES[status // 10]
+    return "UNKNOWN"
+
+
+# Full category ranges as frozensets: the predicates below run per response
+# (and per redirect hop on the client), and a small-int set probe is a single
+# C-level hash lookup instead of chained comparisons
+_INPUT_CODES = frozenset(range(10, 20))
+_SUCCESS_CODES = frozenset(range(20, 30))
+_REDIRECT_CODES = frozenset(range(30, 40))
+_ERROR_CODES = frozenset(range(40, 70))
 
 
 def is_success(status: int) -> bool:
@@ -117,7 +126,7 @@ def is_success(status: int) -> bool:
     Returns:
         True if the status code is in the success range (20-29).
     """
-    return 20 <= status < 30
+    return status in _SUCCESS_CODES
 
 
 def is_redirect(status: int) -> bool:
@@ -129,7 +138,7 @@ def is_redirect(status: int) -> bool:
     Returns:
         True if the status code is in the redirect range (30-39).
     """
-    return 30 <= status < 40
+    return status in _REDIRECT_CODES
 
 
 def is_input_required(status: int) -> bool:
@@ -141,7 +150,7 @@ def is_input_required(status: int) -> bool:
     Returns:
         True if the status code is in the input range (10-19).
     """
-    return 10 <= status < 20
+    return status in _INPUT_CODES
 
 
 def is_error(status: int) -> bool:
@@ -153,4 +162,4 @@ def is_error(status: int) -> bool:
     Returns:
         True if the status code indicates any type of error.
     """
-    return 40 <= status < 70
+    return status in _ERROR_CODES
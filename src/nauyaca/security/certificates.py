@@ -6,12 +6,13 @@ for use with Gemini protocol servers and clients.
 
 import datetime
 import hashlib
+from functools import lru_cache
 from pathlib import Path
 from typing import cast
 
 from cryptography import x509
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
 from cryptography.x509.oid import NameOID
 
 
@@ -19,27 +20,40 @@ def generate_self_signed_cert(
     hostname: str,
     key_size: int = 2048,
     valid_days: int = 365,
+    key_type: str = "rsa",
 ) -> tuple[bytes, bytes]:
     """Generate a self-signed TLS certificate.
 
     Args:
         hostname: Hostname for the certificate (CN and SAN).
-        key_size: RSA key size in bits (default: 2048).
+        key_size: RSA key size in bits (default: 2048). Ignored for EC keys.
         valid_days: Certificate validity period in days (default: 365).
+        key_type: Key algorithm, "rsa" (default) or "ec". EC uses the P-256
+            curve; key generation is orders of magnitude faster than RSA,
+            which matters for throwaway dev certificates.
 
     Returns:
         Tuple of (certificate_pem, private_key_pem) as bytes.
 
+    Raises:
+        ValueError: If key_type is not "rsa" or "ec".
+
     Example:
         >>> cert_pem, key_pem = generate_self_signed_cert("localhost")
         >>> Path("cert.pem").write_bytes(cert_pem)
         >>> Path("key.pem").write_bytes(key_pem)
     """
     # Generate private key
-    private_key = rsa.generate_private_key(
-        public_exponent=65537,
-        key_size=key_size,
-    )
+    private_key: rsa.RSAPrivateKey | ec.EllipticCurvePrivateKey
+    if key_type == "rsa":
+        private_key = rsa.generate_private_key(
+            public_exponent=65537,
+            key_size=key_size,
+        )
+    elif key_type == "ec":
+        private_key = ec.generate_private_key(ec.SECP256R1())
+    else:
+        raise ValueError(f"Unsupported key type: {key_type}")
 
     # Create certificate subject
     subject = issuer = x509.Name(
@@ -105,6 +119,31 @@ def load_certificate(cert_path: Path) -> x509.Certificate:
         raise ValueError(f"Invalid certificate file: {e}") from e
 
 
+@lru_cache(maxsize=1024)
+def _fingerprint_digest(cert_der: bytes, algorithm: str) -> str:
+    """Hash DER certificate bytes, memoized by certificate identity.
+
+    Fingerprinting sits on the per-connection TOFU verify path; repeat
+    connections to the same host present byte-identical DER, so the hash
+    becomes a cache lookup after the first connection.
+
+    Args:
+        cert_der: The certificate in DER encoding.
+        algorithm: Hash algorithm name ("sha256" or "sha1").
+
+    Returns:
+        Hex-encoded digest string.
+
+    Raises:
+        ValueError: If the algorithm is not supported.
+    """
+    if algorithm == "sha256":
+        return hashlib.sha256(cert_der).hexdigest()
+    if algorithm == "sha1":
+        return hashlib.sha1(cert_der).hexdigest()
+    raise ValueError(f"Unsupported algorithm: {algorithm}")
+
+
 def get_certificate_fingerprint(cert: x509.Certificate, algorithm: str = "sha256") -> str:
     """Calculate the fingerprint of a certificate.
 
@@ -122,15 +161,7 @@ def get_certificate_fingerprint(cert: x509.Certificate, algorithm: str = "sha256
         'sha256:a1b2c3d4e5f6...'
     """
     cert_der = cert.public_bytes(serialization.Encoding.DER)
-
-    if algorithm == "sha256":
-        digest = hashlib.sha256(cert_der).hexdigest()
-    elif algorithm == "sha1":
-        digest = hashlib.sha1(cert_der).hexdigest()
-    else:
-        raise ValueError(f"Unsupported algorithm: {algorithm}")
-
-    return f"{algorithm}:{digest}"
+    return f"{algorithm}:{_fingerprint_digest(cert_der, algorithm)}"
 
 
 def get_certificate_fingerprint_from_path(
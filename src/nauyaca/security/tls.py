@@ -108,6 +108,12 @@ def create_server_context(
     # Set minimum TLS version (Gemini requires TLS 1.2+)
     context.minimum_version = ssl.TLSVersion.TLSv1_2
 
+    # Session resumption: make sure tickets are not disabled and hand out a
+    # few TLS 1.3 tickets per connection, so clients that poll a capsule can
+    # skip the certificate signature on reconnect
+    context.options &= ~ssl.OP_NO_TICKET
+    context.num_tickets = 4
+
     # Load server certificate and key
     context.load_cert_chain(certfile, keyfile)
 
@@ -10,7 +10,7 @@ import datetime
 import re
 import sqlite3
 import sys
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 
 if sys.version_info >= (3, 11):
     import tomllib
@@ -33,6 +33,9 @@ class TOFUDatabase:
     methods for trusting, verifying, and revoking certificates.
     """
 
+    # Flush queued last_seen updates once this many have accumulated
+    _FLUSH_THRESHOLD = 64
+
     def __init__(self, db_path: Path | None = None):
         """Initialize the TOFU database.
 
@@ -48,6 +51,14 @@ class TOFUDatabase:
             db_path = nauyaca_dir / "tofu.db"
 
         self.db_path = db_path
+        # In-memory (hostname, port) -> fingerprint cache, populated lazily
+        # from reads and kept coherent by the write paths. Repeat verifies
+        # against a known host become a dict lookup instead of a SELECT.
+        self._cache: dict[tuple[str, int], str] = {}
+        # Write-behind queue of (last_seen, hostname, port) rows. Successful
+        # verifies append here instead of committing immediately; the queue is
+        # flushed in batches so repeat verifications stay CPU-only.
+        self._pending_updates: list[tuple[str, str, int]] = []
         self._initialize_db()
 
     def _initialize_db(self) -> None:
@@ -55,6 +66,10 @@ class TOFUDatabase:
         with self._connection() as conn:
             cursor = conn.cursor()
 
+            # WAL mode is persistent: readers no longer block on writers and
+            # commits avoid rewriting the rollback journal.
+            cursor.execute("PRAGMA journal_mode=WAL")
+
             cursor.execute(
                 """
                 CREATE TABLE IF NOT EXISTS known_hosts (
@@ -81,11 +96,41 @@ class TOFUDatabase:
         """
         conn = sqlite3.connect(str(self.db_path))
         conn.row_factory = sqlite3.Row
+        # Per-connection pragmas: NORMAL sync is safe under WAL and skips an
+        # fsync per commit; temp structures stay off the filesystem.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        # Memory-map the database (256 MB cap) so reads bypass the pager's
+        # copy into connection-local buffers
+        conn.execute("PRAGMA mmap_size=268435456")
         try:
             yield conn
         finally:
             conn.close()
 
+    def _flush_pending(self) -> None:
+        """Write queued last_seen updates to the database in one transaction."""
+        if not self._pending_updates:
+            return
+
+        with self._connection() as conn:
+            conn.executemany(
+                "UPDATE known_hosts SET last_seen = ? WHERE hostname = ? AND port = ?",
+                self._pending_updates,
+            )
+            conn.commit()
+
+        self._pending_updates.clear()
+
+    def close(self) -> None:
+        """Flush any pending writes.
+
+        Connections are opened per operation, so there is nothing to close
+        beyond draining the last_seen write-behind queue. Safe to call more
+        than once.
+        """
+        self._flush_pending()
+
     def trust(self, hostname: str, port: int, cert: x509.Certificate) -> None:
         """Trust a certificate for a host.
 
@@ -101,38 +146,23 @@ class TOFUDatabase:
         now = datetime.datetime.now(datetime.timezone.utc).isoformat()
 
         with self._connection() as conn:
-            cursor = conn.cursor()
-
-            # Check if host already exists
-            cursor.execute(
-                "SELECT fingerprint FROM known_hosts WHERE hostname = ? AND port = ?",
-                (hostname, port),
+            # Single upsert instead of SELECT + INSERT/UPDATE: first_seen is
+            # preserved for known hosts, fingerprint and last_seen replaced
+            conn.execute(
+                """
+                INSERT INTO known_hosts
+                (hostname, port, fingerprint, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(hostname, port) DO UPDATE SET
+                    fingerprint = excluded.fingerprint,
+                    last_seen = excluded.last_seen
+                """,
+                (hostname, port, fingerprint, now, now),
             )
-            row = cursor.fetchone()
-
-            if row is None:
-                # First time seeing this host
-                cursor.execute(
-                    """
-                    INSERT INTO known_hosts
-                    (hostname, port, fingerprint, first_seen, last_seen)
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
-                    (hostname, port, fingerprint, now, now),
-                )
-            else:
-                # Update existing entry
-                cursor.execute(
-                    """
-                    UPDATE known_hosts
-                    SET fingerprint = ?, last_seen = ?
-                    WHERE hostname = ? AND port = ?
-                    """,
-                    (fingerprint, now, hostname, port),
-                )
-
             conn.commit()
 
+        self._cache[(hostname, port)] = fingerprint
+
     def verify(
         self, hostname: str, port: int, cert: x509.Certificate
     ) -> tuple[bool, str]:
@@ -151,34 +181,92 @@ class TOFUDatabase:
         """
         fingerprint = get_certificate_fingerprint(cert)
 
-        with self._connection() as conn:
-            cursor = conn.cursor()
+        # Fast path: fingerprint already cached in memory
+        stored_fingerprint = self._cache.get((hostname, port))
 
-            cursor.execute(
-                "SELECT fingerprint FROM known_hosts WHERE hostname = ? AND port = ?",
-                (hostname, port),
-            )
-            row = cursor.fetchone()
+        if stored_fingerprint is None:
+            with self._connection() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute(
+                    "SELECT fingerprint FROM known_hosts WHERE hostname = ? AND port = ?",
+                    (hostname, port),
+                )
+                row = cursor.fetchone()
 
             if row is None:
                 # First time seeing this host
                 return True, "first_use"
 
             stored_fingerprint = row["fingerprint"]
+            self._cache[(hostname, port)] = stored_fingerprint
+
+        if stored_fingerprint == fingerprint:
+            # Certificate matches - queue the last_seen update for a batched
+            # flush instead of paying a commit per verification
+            now = datetime.datetime.now(datetime.timezone.utc).isoformat()
+            self._pending_updates.append((now, hostname, port))
+            if len(self._pending_updates) >= self._FLUSH_THRESHOLD:
+                self._flush_pending()
+            return True, ""
+
+        # Certificate has changed
+        return False, "changed"
+
+    def verify_many(
+        self, entries: list[tuple[str, int, x509.Certificate]]
+    ) -> list[tuple[bool, str]]:
+        """Verify several certificates with one database round-trip.
+
+        Each entry gets the same result verify() would produce, but hosts
+        missing from the in-memory cache are fetched with a single SELECT
+        instead of one query per host — useful for bulk TOFU audits and
+        concurrent fetch fan-out.
 
-            if stored_fingerprint == fingerprint:
-                # Certificate matches - update last_seen
-                now = datetime.datetime.now(datetime.timezone.utc).isoformat()
-                cursor.execute(
-                    "UPDATE known_hosts SET last_seen = ? "
-                    "WHERE hostname = ? AND port = ?",
-                    (now, hostname, port),
+        Args:
+            entries: List of (hostname, port, certificate) tuples.
+
+        Returns:
+            List of (is_valid, message) tuples, one per entry, in input
+            order, with the same semantics as verify().
+        """
+        if not entries:
+            return []
+
+        # Fetch all cache misses in one query
+        missing = {
+            (hostname, port)
+            for hostname, port, _ in entries
+            if (hostname, port) not in self._cache
+        }
+        if missing:
+            placeholders = ", ".join(["(?, ?)"] * len(missing))
+            params = [value for key in missing for value in key]
+            with self._connection() as conn:
+                cursor = conn.execute(
+                    "SELECT hostname, port, fingerprint FROM known_hosts "
+                    f"WHERE (hostname, port) IN (VALUES {placeholders})",
+                    params,
                 )
-                conn.commit()
-                return True, ""
+                for row in cursor:
+                    self._cache[(row["hostname"], row["port"])] = row["fingerprint"]
+
+        now = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        results: list[tuple[bool, str]] = []
+        for hostname, port, cert in entries:
+            stored_fingerprint = self._cache.get((hostname, port))
+            if stored_fingerprint is None:
+                results.append((True, "first_use"))
+            elif stored_fingerprint == get_certificate_fingerprint(cert):
+                self._pending_updates.append((now, hostname, port))
+                results.append((True, ""))
+            else:
+                results.append((False, "changed"))
 
-            # Certificate has changed
-            return False, "changed"
+        if len(self._pending_updates) >= self._FLUSH_THRESHOLD:
+            self._flush_pending()
+
+        return results
 
     def revoke(self, hostname: str, port: int) -> bool:
         """Remove a host from the TOFU database.
@@ -199,6 +287,7 @@ class TOFUDatabase:
             )
             conn.commit()
 
+            self._cache.pop((hostname, port), None)
             return cursor.rowcount > 0
 
     def count_by_hostname(self, hostname: str) -> int:
@@ -240,27 +329,39 @@ class TOFUDatabase:
             )
             conn.commit()
 
+            for key in [k for k in self._cache if k[0] == hostname]:
+                del self._cache[key]
             return cursor.rowcount
 
-    def list_hosts(self) -> list[dict[str, str]]:
-        """List all known hosts in the database.
+    def iter_hosts(self) -> "Iterator[dict[str, str]]":
+        """Iterate over all known hosts without materializing the full list.
 
-        Returns:
-            List of dictionaries containing host information.
+        The database connection stays open until the generator is exhausted
+        or closed, so prefer :meth:`list_hosts` unless streaming matters.
+
+        Yields:
+            Dictionaries containing host information, most recently seen first.
         """
-        with self._connection() as conn:
-            cursor = conn.cursor()
+        self._flush_pending()
 
-            cursor.execute(
+        with self._connection() as conn:
+            cursor = conn.execute(
                 """
                 SELECT hostname, port, fingerprint, first_seen, last_seen
                 FROM known_hosts
                 ORDER BY last_seen DESC
                 """
             )
+            for row in cursor:
+                yield dict(row)
+
+    def list_hosts(self) -> list[dict[str, str]]:
+        """List all known hosts in the database.
 
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+        Returns:
+            List of dictionaries containing host information.
+        """
+        return list(self.iter_hosts())
 
     def clear(self) -> int:
         """Clear all entries from the TOFU database.
@@ -274,6 +375,7 @@ class TOFUDatabase:
             cursor.execute("DELETE FROM known_hosts")
             conn.commit()
 
+            self._cache.clear()
             return cursor.rowcount
 
     def get_host_info(self, hostname: str, port: int) -> dict[str, str] | None:
@@ -286,6 +388,8 @@ class TOFUDatabase:
         Returns:
             Dictionary containing host information, or None if not found.
         """
+        self._flush_pending()
+
         with self._connection() as conn:
             cursor = conn.cursor()
 
@@ -438,6 +542,7 @@ class TOFUDatabase:
                         """,
                         (hostname, port, fingerprint, first_seen, now),
                     )
+                    self._cache[(hostname, port)] = fingerprint
                     added_count += 1
                 elif existing["fingerprint"] == fingerprint:
                     # Same fingerprint - skip
@@ -462,6 +567,7 @@ class TOFUDatabase:
                             """,
                             (fingerprint, now, hostname, port),
                         )
+                        self._cache[(hostname, port)] = fingerprint
                         updated_count += 1
                     else:
                         skipped_count += 1
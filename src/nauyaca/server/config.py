@@ -3,6 +3,8 @@
 This module provides configuration data structures for the Gemini server.
 """
 
+import os
+import stat
 import sys
 from dataclasses import dataclass
 
@@ -104,19 +106,32 @@ class ServerConfig:
         if isinstance(self.keyfile, str):
             self.keyfile = Path(self.keyfile)
 
-        # Validate document root
-        if not self.document_root.exists():
-            raise ValueError(f"Document root does not exist: {self.document_root}")
+        # Validate document root with a single stat call (exists + is_dir
+        # would each stat the path again)
+        try:
+            root_stat = os.stat(self.document_root)
+        except OSError:
+            raise ValueError(
+                f"Document root does not exist: {self.document_root}"
+            ) from None
 
-        if not self.document_root.is_dir():
+        if not stat.S_ISDIR(root_stat.st_mode):
             raise ValueError(f"Document root is not a directory: {self.document_root}")
 
         # Validate certificate files if provided
-        if self.certfile and not self.certfile.exists():
-            raise ValueError(f"Certificate file does not exist: {self.certfile}")
+        if self.certfile is not None:
+            try:
+                os.stat(self.certfile)
+            except OSError:
+                raise ValueError(
+                    f"Certificate file does not exist: {self.certfile}"
+                ) from None
 
-        if self.keyfile and not self.keyfile.exists():
-            raise ValueError(f"Key file does not exist: {self.keyfile}")
+        if self.keyfile is not None:
+            try:
+                os.stat(self.keyfile)
+            except OSError:
+                raise ValueError(f"Key file does not exist: {self.keyfile}") from None
 
         # Validate port range
         if not (1 <= self.port <= 65535):
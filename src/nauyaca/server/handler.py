@@ -5,6 +5,7 @@ and generating responses, including Titan upload handlers.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -52,6 +53,8 @@ class StaticFileHandler(RequestHandler):
         document_root: Path to the directory containing files to serve.
         default_indices: List of index filenames to try for directory requests.
         max_file_size: Maximum file size to serve (in bytes).
+        not_found: Optional callable invoked on path misses to build the
+            404 response.
 
     Examples:
         >>> handler = StaticFileHandler(Path("/var/gemini/capsule"))
@@ -65,6 +68,7 @@ class StaticFileHandler(RequestHandler):
         default_indices: list[str] | None = None,
         enable_directory_listing: bool = False,
         max_file_size: int | None = None,
+        not_found: Callable[[GeminiRequest], GeminiResponse] | None = None,
     ) -> None:
         """Initialize the static file handler.
 
@@ -76,11 +80,15 @@ class StaticFileHandler(RequestHandler):
                 directories without an index file (default: False).
             max_file_size: Maximum file size to serve in bytes
                 (default: 100 MiB per Gemini best practices).
+            not_found: Optional callable that builds the 404 response on a
+                path miss, avoiding a separate router fallback. When None,
+                a plain "51 Not found" response is returned.
         """
         self.document_root = Path(document_root).resolve()
         self.default_indices = default_indices or ["index.gmi", "index.gemini"]
         self.enable_directory_listing = enable_directory_listing
         self.max_file_size = max_file_size or DEFAULT_MAX_FILE_SIZE
+        self.not_found = not_found
 
         if not self.document_root.exists():
             raise ValueError(f"Document root does not exist: {self.document_root}")
@@ -104,7 +112,7 @@ class StaticFileHandler(RequestHandler):
 
         # Path traversal protection: ensure the resolved path is within document root
         if not self._is_safe_path(file_path):
-            return GeminiResponse(status=StatusCode.NOT_FOUND.value, meta="Not found")
+            return self._not_found_response(request)
 
         # If path is a directory, try to serve an index file or generate listing
         if file_path.is_dir():
@@ -134,13 +142,11 @@ class StaticFileHandler(RequestHandler):
                         )
                 else:
                     # No index and directory listing disabled
-                    return GeminiResponse(
-                        status=StatusCode.NOT_FOUND.value, meta="Not found"
-                    )
+                    return self._not_found_response(request)
 
         # Check if file exists
         if not file_path.exists() or not file_path.is_file():
-            return GeminiResponse(status=StatusCode.NOT_FOUND.value, meta="Not found")
+            return self._not_found_response(request)
 
         # Check file size (per Gemini best practices, avoid files >100 MiB)
         file_size = file_path.stat().st_size
@@ -178,6 +184,19 @@ class StaticFileHandler(RequestHandler):
                 meta=f"Server error: {str(e)}",
             )
 
+    def _not_found_response(self, request: GeminiRequest) -> GeminiResponse:
+        """Build the 404 response for a path miss.
+
+        Args:
+            request: The request that missed.
+
+        Returns:
+            The response from the not_found callback, or a plain 51 response.
+        """
+        if self.not_found is not None:
+            return self.not_found(request)
+        return GeminiResponse(status=StatusCode.NOT_FOUND.value, meta="Not found")
+
     def _is_safe_path(self, file_path: Path) -> bool:
         """Check if a file path is within the document root (path traversal protection).
 
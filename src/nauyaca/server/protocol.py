@@ -9,6 +9,7 @@ Supports both protocols on the same port:
 """
 
 import asyncio
+import logging
 import time
 from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING
@@ -29,6 +30,10 @@ logger = get_logger(__name__)
 # Connection timeout in seconds
 REQUEST_TIMEOUT = 30.0
 
+# Pre-encoded "<STATUS><SPACE>" header prefixes for the known status codes;
+# unknown codes fall back to formatting at send time
+_STATUS_PREFIX = {code.value: f"{code.value} ".encode() for code in StatusCode}
+
 
 class GeminiServerProtocol(asyncio.Protocol):
     """Server-side protocol for handling Gemini and Titan requests.
@@ -78,8 +83,9 @@ class GeminiServerProtocol(asyncio.Protocol):
         self.middleware = middleware
         self.upload_handler = upload_handler
         self.transport: asyncio.Transport | None = None
-        self.buffer = b""
+        self.buffer = bytearray()
         self.peer_name: tuple[str, int] | None = None
+        self._client_ip = "unknown"
         self.request_start_time: float | None = None
         self.timeout_handle: asyncio.TimerHandle | None = None
 
@@ -97,7 +103,10 @@ class GeminiServerProtocol(asyncio.Protocol):
         self.transport = transport  # type: ignore[assignment]
         if self.transport:
             self.peer_name = self.transport.get_extra_info("peername")
-        self.request_start_time = time.time()
+        # Cache the formatted client address once per connection
+        self._client_ip = self.peer_name[0] if self.peer_name else "unknown"
+        # Monotonic clock: cheaper than wall time and immune to clock jumps
+        self.request_start_time = time.monotonic()
 
         # Set timeout for receiving request
         try:
@@ -107,11 +116,12 @@ class GeminiServerProtocol(asyncio.Protocol):
             # No event loop running (probably in tests)
             self.timeout_handle = None
 
-        logger.debug(
-            "connection_established",
-            client_ip=self.peer_name[0] if self.peer_name else "unknown",
-            client_port=self.peer_name[1] if self.peer_name else 0,
-        )
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "connection_established",
+                client_ip=self._client_ip,
+                client_port=self.peer_name[1] if self.peer_name else 0,
+            )
 
     def data_received(self, data: bytes) -> None:
         """Called when data is received from the client.
@@ -125,52 +135,49 @@ class GeminiServerProtocol(asyncio.Protocol):
         Args:
             data: Raw bytes received from the client.
         """
-        self.buffer += data
-
         # State 1: Waiting for URL line (Gemini or Titan)
         if not self.url_line_received:
+            if not self.buffer:
+                # Fast path: the full URL line typically arrives in the first
+                # packet, so the line is sliced straight out of `data` and the
+                # accumulation buffer only sees any trailing Titan content
+                crlf_index = data.find(CRLF)
+                if crlf_index == -1:
+                    if len(data) > MAX_REQUEST_SIZE:
+                        self._send_error_response(
+                            StatusCode.BAD_REQUEST,
+                            "Request exceeds maximum size (1024 bytes)",
+                        )
+                        return
+                    self.buffer.extend(data)
+                    return
+                self.buffer.extend(memoryview(data)[crlf_index + len(CRLF) :])
+                self._consume_url_line(data[:crlf_index])
+                return
+
+            # Slow path: URL line fragmented across packets. Resume the CRLF
+            # scan just before the new data so a delimiter split across two
+            # packets is still found, without rescanning old bytes
+            scan_start = max(0, len(self.buffer) - 1)
+            self.buffer.extend(data)
+            crlf_index = self.buffer.find(CRLF, scan_start)
+
             # Check if buffer exceeds maximum size without CRLF (DoS protection)
-            if len(self.buffer) > MAX_REQUEST_SIZE and CRLF not in self.buffer:
+            if len(self.buffer) > MAX_REQUEST_SIZE and crlf_index == -1:
                 self._send_error_response(
                     StatusCode.BAD_REQUEST, "Request exceeds maximum size (1024 bytes)"
                 )
                 return
 
             # Check if we have a complete URL line (ends with CRLF)
-            if CRLF in self.buffer:
-                url_line, remaining = self.buffer.split(CRLF, 1)
-
-                # Check if URL line itself exceeds maximum size
-                # MAX_REQUEST_SIZE includes CRLF, so check url_line + 2
-                if len(url_line) + 2 > MAX_REQUEST_SIZE:
-                    self._send_error_response(
-                        StatusCode.BAD_REQUEST,
-                        "Request exceeds maximum size (1024 bytes)",
-                    )
-                    return
-
-                self.buffer = remaining
-                self.url_line_received = True
-
-                try:
-                    url = url_line.decode("utf-8")
-                except UnicodeDecodeError:
-                    self._send_error_response(
-                        StatusCode.BAD_REQUEST, "Invalid UTF-8 encoding"
-                    )
-                    return
-
-                # Protocol detection: Titan vs Gemini
-                if url.startswith("titan://"):
-                    self._handle_titan_url(url)
-                else:
-                    # Cancel timeout - we got the complete Gemini request
-                    if self.timeout_handle:
-                        self.timeout_handle.cancel()
-                        self.timeout_handle = None
-                    self._handle_gemini_request(url)
+            if crlf_index != -1:
+                url_line = bytes(self.buffer[:crlf_index])
+                del self.buffer[: crlf_index + len(CRLF)]
+                self._consume_url_line(url_line)
             return
 
+        self.buffer.extend(data)
+
         # State 2: Waiting for Titan content
         if self.awaiting_titan_content and self.titan_request:
             if len(self.buffer) >= self.titan_request.size:
@@ -180,9 +187,44 @@ class GeminiServerProtocol(asyncio.Protocol):
                     self.timeout_handle = None
 
                 # Extract exactly the expected number of bytes
-                self.titan_request.content = self.buffer[: self.titan_request.size]
+                self.titan_request.content = bytes(self.buffer[: self.titan_request.size])
                 self._process_titan_upload()
 
+    def _consume_url_line(self, url_line: bytes) -> None:
+        """Validate and dispatch a complete URL line.
+
+        Any Titan content following the line must already be in the buffer.
+
+        Args:
+            url_line: The URL line bytes, without the trailing CRLF.
+        """
+        # Check if URL line itself exceeds maximum size
+        # MAX_REQUEST_SIZE includes CRLF, so check url_line + 2
+        if len(url_line) + 2 > MAX_REQUEST_SIZE:
+            self._send_error_response(
+                StatusCode.BAD_REQUEST,
+                "Request exceeds maximum size (1024 bytes)",
+            )
+            return
+
+        self.url_line_received = True
+
+        try:
+            url = url_line.decode("utf-8")
+        except UnicodeDecodeError:
+            self._send_error_response(StatusCode.BAD_REQUEST, "Invalid UTF-8 encoding")
+            return
+
+        # Protocol detection: Titan vs Gemini
+        if url.startswith("titan://"):
+            self._handle_titan_url(url)
+        else:
+            # Cancel timeout - we got the complete Gemini request
+            if self.timeout_handle:
+                self.timeout_handle.cancel()
+                self.timeout_handle = None
+            self._handle_gemini_request(url)
+
     def _handle_gemini_request(self, url: str) -> None:
         """Process a Gemini request and send response.
 
@@ -208,7 +250,7 @@ class GeminiServerProtocol(asyncio.Protocol):
         request.client_cert = client_cert
         request.client_cert_fingerprint = client_cert_fingerprint
 
-        client_ip = self.peer_name[0] if self.peer_name else "unknown"
+        client_ip = self._client_ip
 
         # Process through middleware if present
         if self.middleware:
@@ -246,32 +288,37 @@ class GeminiServerProtocol(asyncio.Protocol):
         if not self.transport:
             return
 
-        # Calculate request duration
-        duration_ms = 0.0
-        if self.request_start_time:
-            duration_ms = (time.time() - self.request_start_time) * 1000
-
-        # Log the request
-        logger.info(
-            "request_completed",
-            client_ip=self.peer_name[0] if self.peer_name else "unknown",
-            status=response.status,
-            path=response.url or "unknown",
-            body_size=len(response.body) if response.body else 0,
-            duration_ms=round(duration_ms, 2),
-        )
-
-        # Build response header: <STATUS><SPACE><META><CRLF>
-        header = f"{response.status} {response.meta}\r\n"
-        self.transport.write(header.encode("utf-8"))
-
-        # Send body if present (only for 2x success responses)
-        # FIX: Handle both text (str) and binary (bytes) content
-        if response.body:
-            if isinstance(response.body, bytes):
-                self.transport.write(response.body)
-            else:
-                self.transport.write(response.body.encode("utf-8"))
+        # Log the request; skip building the event kwargs entirely when the
+        # info level is filtered out
+        if logger.is_enabled_for(logging.INFO):
+            duration_ms = 0.0
+            if self.request_start_time:
+                duration_ms = (time.monotonic() - self.request_start_time) * 1000
+
+            logger.info(
+                "request_completed",
+                client_ip=self._client_ip,
+                status=response.status,
+                path=response.url or "unknown",
+                body_size=len(response.body) if response.body else 0,
+                duration_ms=round(duration_ms, 2),
+            )
+
+        # Build response header: <STATUS><SPACE><META><CRLF> from the
+        # pre-encoded status prefix
+        prefix = _STATUS_PREFIX.get(response.status)
+        if prefix is None:
+            prefix = f"{response.status} ".encode()
+        header = prefix + response.meta.encode("utf-8") + CRLF
+
+        # Send header and body together so asyncio coalesces them into one
+        # write (one TLS record batch) instead of two. body_bytes memoizes the
+        # encoded form, so a reused response is encoded only once.
+        body = response.body_bytes
+        if body:
+            self.transport.writelines([header, body])
+        else:
+            self.transport.write(header)
 
         # Close connection (Gemini/Titan: one request per connection)
         self.transport.close()
@@ -293,12 +340,12 @@ class GeminiServerProtocol(asyncio.Protocol):
         """Handle request timeout."""
         if self.transport and not self.transport.is_closing():
             if self.request_start_time:
-                duration = time.time() - self.request_start_time
+                duration = time.monotonic() - self.request_start_time
             else:
                 duration = 0
             logger.warning(
                 "request_timeout",
-                client_ip=self.peer_name[0] if self.peer_name else "unknown",
+                client_ip=self._client_ip,
                 duration_ms=round(duration * 1000, 2),
             )
             # Send timeout response
@@ -535,7 +582,7 @@ class GeminiServerProtocol(asyncio.Protocol):
                 if self.timeout_handle:
                     self.timeout_handle.cancel()
                     self.timeout_handle = None
-                self.titan_request.content = self.buffer[: self.titan_request.size]
+                self.titan_request.content = bytes(self.buffer[: self.titan_request.size])
                 self._process_titan_upload()
 
     def _process_titan_upload(self) -> None:
@@ -546,7 +593,7 @@ class GeminiServerProtocol(asyncio.Protocol):
             )
             return
 
-        client_ip = self.peer_name[0] if self.peer_name else "unknown"
+        client_ip = self._client_ip
 
         try:
             # Create async task for upload handler
@@ -4,6 +4,8 @@ This module provides functions for starting and managing Gemini servers.
 """
 
 import asyncio
+import functools
+import socket
 import ssl
 import tempfile
 from pathlib import Path
@@ -28,9 +30,20 @@ from .middleware import (
     RateLimiter,
 )
 from .protocol import GeminiServerProtocol
-from .router import Router
+from .router import Router, RouteType
 from .tls_protocol import TLSServerProtocol
 
+logger = get_logger(__name__)
+
+# Hoisted 404 constants: the default miss handler runs for every unmatched
+# request (bots probing common paths), so the enum .value lookups happen once
+_NOT_FOUND_STATUS = StatusCode.NOT_FOUND.value
+_NOT_FOUND_META = "text/gemini"
+
+# Repeat-miss crawlers hammer the same handful of paths; cache the rendered
+# 404 bodies so each distinct path is templated once
+_error_404_body = functools.lru_cache(maxsize=512)(error_404)
+
 
 async def start_server(
     config: ServerConfig,
@@ -89,7 +102,6 @@ async def start_server(
         json_logs=json_logs,
         hash_ips=effective_hash_ips,
     )
-    logger = get_logger(__name__)
 
     # Validate configuration
     config.validate()
@@ -108,9 +120,9 @@ async def start_server(
         else:
             path = "/"
         return GeminiResponse(
-            status=StatusCode.NOT_FOUND.value,
-            meta="text/gemini",
-            body=error_404(path),
+            status=_NOT_FOUND_STATUS,
+            meta=_NOT_FOUND_META,
+            body=_error_404_body(path),
         )
 
     # Create router - use location-based routing if configured, else simple static
@@ -128,16 +140,16 @@ async def start_server(
             prefixes=[loc.prefix for loc in config.locations],
         )
     else:
-        # Fallback: simple static file handler for document_root
-        from .router import RouteType
-
+        # Fallback: simple static file handler for document_root. The 404
+        # handler is fused into the static handler itself: the "/" prefix
+        # route always matches, so a separate router default would never run.
         router = Router()
         static_handler = StaticFileHandler(
             config.document_root,
             enable_directory_listing=enable_directory_listing,
             max_file_size=effective_max_file_size,
+            not_found=default_404_handler,
         )
-        router.set_default_handler(default_404_handler)
         router.add_route("/", static_handler.handle, route_type=RouteType.PREFIX)
 
     # Determine if we need to request client certificates
@@ -254,6 +266,11 @@ async def start_server(
     # Get event loop
     loop = asyncio.get_running_loop()
 
+    # SO_REUSEPORT lets multiple server processes bind the same port and have
+    # the kernel load-balance connections across them; not available everywhere.
+    # TCP_NODELAY needs no handling here: asyncio sets it on every TCP transport.
+    reuse_port = hasattr(socket, "SO_REUSEPORT")
+
     # Create server using Protocol pattern
     if use_pyopenssl and pyopenssl_ctx is not None:
         # Use PyOpenSSL TLS wrapper - NO ssl= parameter since TLS is handled manually
@@ -264,6 +281,7 @@ async def start_server(
             ),
             config.host,
             config.port,
+            reuse_port=reuse_port,
             # NO ssl= parameter - TLS handled by TLSServerProtocol
         )
     else:
@@ -273,6 +291,7 @@ async def start_server(
             config.host,
             config.port,
             ssl=ssl_context,
+            reuse_port=reuse_port,
         )
 
     logger.info(
@@ -287,11 +306,17 @@ async def start_server(
         await server.serve_forever()
 
 
+@functools.lru_cache(maxsize=4)
 def _create_self_signed_context(request_client_cert: bool = False) -> ssl.SSLContext:
     """Create a self-signed SSL context for testing.
 
     WARNING: This is for testing only! Do not use in production.
 
+    The context is cached per request_client_cert flag: dev loops and test
+    harnesses that start servers repeatedly skip the RSA keygen after the
+    first call, and the shared context keeps OpenSSL's session cache warm
+    across restarts.
+
     Args:
         request_client_cert: Whether to request client certificates.
 
@@ -300,10 +325,12 @@ def _create_self_signed_context(request_client_cert: bool = False) -> ssl.SSLCon
     """
     # Generate self-signed certificate using cryptography library
     try:
+        # EC P-256: keygen is near-instant compared to an RSA prime search,
+        # which is all that matters for a throwaway dev certificate
         cert_pem, key_pem = generate_self_signed_cert(
             hostname="localhost",
-            key_size=2048,
             valid_days=365,
+            key_type="ec",
         )
     except Exception as e:
         raise RuntimeError(f"Failed to generate self-signed certificate: {e}") from e
@@ -318,9 +345,12 @@ def _create_self_signed_context(request_client_cert: bool = False) -> ssl.SSLCon
         certfile.flush()
         keyfile.flush()
 
-        print("[Server] WARNING: Using self-signed certificate (testing only!)")
-        print(f"[Server] Certificate: {certfile.name}")
-        print(f"[Server] Key: {keyfile.name}")
+        logger.warning(
+            "self_signed_certificate_generated",
+            mode="testing_only",
+            certfile=certfile.name,
+            keyfile=keyfile.name,
+        )
 
         # Use SSLContext directly to avoid loading system CA certs
         # This allows self-signed client certificates to be accepted
@@ -328,6 +358,10 @@ def _create_self_signed_context(request_client_cert: bool = False) -> ssl.SSLCon
         ssl_context.load_cert_chain(certfile.name, keyfile.name)
         ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
 
+        # Enable session resumption for repeat clients (see create_server_context)
+        ssl_context.options &= ~ssl.OP_NO_TICKET
+        ssl_context.num_tickets = 4
+
         # Configure client certificate handling
         if request_client_cert:
             ssl_context.verify_mode = ssl.CERT_OPTIONAL
@@ -337,11 +371,15 @@ def _create_self_signed_context(request_client_cert: bool = False) -> ssl.SSLCon
         return ssl_context
 
 
+@functools.lru_cache(maxsize=1)
 def _create_self_signed_pyopenssl_context() -> Any:
     """Create a self-signed PyOpenSSL context for testing with client certs.
 
     WARNING: This is for testing only! Do not use in production.
 
+    Cached for the same reason as _create_self_signed_context: repeat server
+    starts reuse the generated certificate and context.
+
     This function creates a PyOpenSSL SSL.Context with a self-signed certificate,
     configured to accept any client certificate (including self-signed).
 
@@ -350,10 +388,12 @@ def _create_self_signed_pyopenssl_context() -> Any:
     """
     # Generate self-signed certificate using cryptography library
     try:
+        # EC P-256: keygen is near-instant compared to an RSA prime search,
+        # which is all that matters for a throwaway dev certificate
         cert_pem, key_pem = generate_self_signed_cert(
             hostname="localhost",
-            key_size=2048,
             valid_days=365,
+            key_type="ec",
         )
     except Exception as e:
         raise RuntimeError(f"Failed to generate self-signed certificate: {e}") from e
@@ -368,10 +408,13 @@ def _create_self_signed_pyopenssl_context() -> Any:
         certfile.flush()
         keyfile.flush()
 
-        print("[Server] WARNING: Using self-signed certificate (testing only!)")
-        print(f"[Server] Certificate: {certfile.name}")
-        print(f"[Server] Key: {keyfile.name}")
-        print("[Server] Using PyOpenSSL for client certificate support")
+        logger.warning(
+            "self_signed_certificate_generated",
+            mode="testing_only",
+            certfile=certfile.name,
+            keyfile=keyfile.name,
+            tls_backend="pyopenssl",
+        )
 
         # Create PyOpenSSL context that accepts any client certificate
         return create_pyopenssl_server_context(
@@ -282,6 +282,17 @@ class TLSTransportWrapper:
             self.tls_protocol.tls_conn.send(data)
             self.tls_protocol._flush_outgoing()
 
+    def writelines(self, list_of_data: list[bytes]) -> None:
+        """Encrypt and send several chunks as one buffered flush.
+
+        Args:
+            list_of_data: Plaintext chunks to encrypt and send.
+        """
+        if self.tls_protocol.tls_conn:
+            for data in list_of_data:
+                self.tls_protocol.tls_conn.send(data)
+            self.tls_protocol._flush_outgoing()
+
     def close(self) -> None:
         """Initiate TLS shutdown and close."""
         if self.tls_protocol.tls_conn:
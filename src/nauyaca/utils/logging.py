@@ -71,9 +71,10 @@ def configure_logging(
     else:
         output_stream = sys.stdout
 
-    # Build base processors
+    # Build base processors. Nothing in the codebase binds contextvars, so
+    # merge_contextvars is deliberately omitted: it would add a context
+    # lookup to every log call on the per-request server path for no gain.
     base_processors = [
-        structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
         structlog.processors.TimeStamper(fmt="iso" if json_logs else "%Y-%m-%d %H:%M:%S"),
     ]
@@ -84,8 +85,20 @@ def configure_logging(
 
     # Configure output format
     if json_logs:
-        # JSON format for production/structured logging
-        processors = base_processors + [structlog.processors.JSONRenderer()]
+        # JSON format for production/structured logging. orjson is optional
+        # but serializes the small per-request event dicts several times
+        # faster than stdlib json on a busy server.
+        try:
+            import orjson
+        except ImportError:
+            renderer = structlog.processors.JSONRenderer()
+        else:
+            renderer = structlog.processors.JSONRenderer(
+                serializer=lambda event_dict, **kw: orjson.dumps(
+                    event_dict, default=str
+                ).decode()
+            )
+        processors = base_processors + [renderer]
     else:
         # Human-readable format for development
         processors = base_processors + [
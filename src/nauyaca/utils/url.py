@@ -4,6 +4,7 @@ This module provides functions for parsing, validating, and normalizing
 Gemini URLs according to the protocol specification.
 """
 
+from functools import lru_cache
 from typing import NamedTuple
 from urllib.parse import urlparse, urlunparse
 
@@ -32,9 +33,14 @@ class ParsedURL(NamedTuple):
     normalized: str
 
 
+@lru_cache(maxsize=1024)
 def parse_url(url: str) -> ParsedURL:
     """Parse and normalize a Gemini URL.
 
+    Results are memoized: parsing is a pure function of the URL string and
+    the returned tuple is immutable, so redirect chains and repeat fetches
+    of the same URL skip the urlparse work.
+
     Args:
         url: A Gemini URL string (e.g., 'gemini://example.com/path').
 
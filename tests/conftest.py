@@ -12,9 +12,13 @@ from nauyaca.security.tls import create_client_context
 from nauyaca.security.tofu import TOFUDatabase
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client_ssl_context() -> ssl.SSLContext:
-    """Create a test SSL context for client connections (no verification)."""
+    """Create a test SSL context for client connections (no verification).
+
+    Session-scoped: tests only read the context when wrapping connections,
+    so one context (and one trust-store load) serves the whole run.
+    """
     return create_client_context(
         verify_mode=ssl.CERT_NONE,
         check_hostname=False,
@@ -23,9 +27,24 @@ def client_ssl_context() -> ssl.SSLContext:
 
 @pytest.fixture
 def unused_tcp_port():
+    """Reserve a free TCP port for the duration of a test.
+
+    Where SO_REUSEPORT is available the scout socket stays bound until
+    teardown, so no other process can grab the port between allocation and
+    the server's bind; test servers join the same reuseport group by
+    passing reuse_port to create_server.
+    """
     with socket.socket() as s:
-        s.bind(("127.0.0.1", 0))
-        return s.getsockname()[1]
+        if hasattr(socket, "SO_REUSEPORT"):
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            s.bind(("127.0.0.1", 0))
+            yield s.getsockname()[1]
+        else:
+            # Fall back to close-then-rebind; a small race window remains
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+            s.close()
+            yield port
 
 
 @pytest.fixture
@@ -1,15 +1,35 @@
 """Property-based tests for GeminiClientProtocol using Hypothesis."""
 
 import asyncio
-from unittest.mock import Mock
 
-from hypothesis import assume, given
+from hypothesis import assume, given, settings
 from hypothesis import strategies as st
 
 from nauyaca.client.protocol import GeminiClientProtocol
 from nauyaca.protocol.constants import CRLF
 
 
+class _StubTransport:
+    """Minimal transport double for property tests.
+
+    Mock records every attribute access and call, which adds up when
+    Hypothesis runs each property a hundred times; this stub keeps just
+    the two facts the assertions need.
+    """
+
+    __slots__ = ("written", "closed")
+
+    def __init__(self) -> None:
+        self.written: bytes | None = None
+        self.closed = False
+
+    def write(self, data: bytes) -> None:
+        self.written = data
+
+    def close(self) -> None:
+        self.closed = True
+
+
 class TestProtocolDataHandlingProperties:
     """Property-based tests for protocol data buffering and handling."""
 
@@ -25,7 +45,7 @@ class TestProtocolDataHandlingProperties:
         future = loop.create_future()
         protocol = GeminiClientProtocol("gemini://example.com/", future)
 
-        transport = Mock()
+        transport = _StubTransport()
         protocol.connection_made(transport)
 
         # Send complete header in one chunk
@@ -41,6 +61,9 @@ class TestProtocolDataHandlingProperties:
         st.text(max_size=100),
         st.integers(min_value=1, max_value=50),
     )
+    # Small chunk sizes drive data_received once per byte; cap the example
+    # count since the unit tests already cover the common boundaries
+    @settings(max_examples=25, deadline=None)
     async def test_chunked_header_parsing(self, status, meta, chunk_size):
         """Headers sent in multiple chunks should parse correctly."""
         # Meta cannot contain newlines as it would break the protocol
@@ -52,7 +75,7 @@ class TestProtocolDataHandlingProperties:
         future = loop.create_future()
         protocol = GeminiClientProtocol("gemini://example.com/", future)
 
-        transport = Mock()
+        transport = _StubTransport()
         protocol.connection_made(transport)
 
         # Build header and split into chunks
@@ -77,7 +100,7 @@ class TestProtocolDataHandlingProperties:
         future = loop.create_future()
         protocol = GeminiClientProtocol("gemini://example.com/", future)
 
-        transport = Mock()
+        transport = _StubTransport()
         protocol.connection_made(transport)
 
         # Send header
@@ -98,6 +121,7 @@ class TestProtocolDataHandlingProperties:
         assert response.body == body_text
 
     @given(st.lists(st.binary(min_size=1, max_size=100), min_size=1, max_size=10))
+    @settings(max_examples=25, deadline=None)
     async def test_arbitrary_chunk_boundaries(self, chunks):
         """Protocol should handle arbitrary chunk boundaries correctly."""
         # Build a valid response with random chunk boundaries
@@ -105,7 +129,7 @@ class TestProtocolDataHandlingProperties:
         future = loop.create_future()
         protocol = GeminiClientProtocol("gemini://example.com/", future)
 
-        transport = Mock()
+        transport = _StubTransport()
         protocol.connection_made(transport)
 
         # Create a valid response
@@ -137,7 +161,7 @@ class TestProtocolDataHandlingProperties:
         future = loop.create_future()
         protocol = GeminiClientProtocol("gemini://example.com/", future)
 
-        transport = Mock()
+        transport = _StubTransport()
         protocol.connection_made(transport)
 
         # Send header with empty meta (just status and CRLF)
@@ -158,12 +182,12 @@ class TestProtocolDataHandlingProperties:
         future = loop.create_future()
         protocol = GeminiClientProtocol(url, future)
 
-        transport = Mock()
+        transport = _StubTransport()
         protocol.connection_made(transport)
 
         # Check what was written
-        transport.write.assert_called_once()
-        sent_data = transport.write.call_args[0][0]
+        assert transport.written is not None
+        sent_data = transport.written
 
         assert sent_data == f"{url}\r\n".encode()
 
@@ -176,14 +200,14 @@ class TestProtocolDataHandlingProperties:
         future = loop.create_future()
         protocol = GeminiClientProtocol("gemini://example.com/", future)
 
-        transport = Mock()
+        transport = _StubTransport()
         protocol.connection_made(transport)
 
         # Send non-success header
         protocol.data_received(f"{status} Some meta\r\n".encode())
 
         # Should close immediately
-        transport.close.assert_called_once()
+        assert transport.closed
 
     @given(st.text(max_size=100))
     async def test_buffer_reset_between_header_and_body(self, body_text):
@@ -194,7 +218,7 @@ class TestProtocolDataHandlingProperties:
         future = loop.create_future()
         protocol = GeminiClientProtocol("gemini://example.com/", future)
 
-        transport = Mock()
+        transport = _StubTransport()
         protocol.connection_made(transport)
 
         # Send header + body together
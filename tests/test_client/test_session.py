@@ -292,6 +292,77 @@ class TestGeminiClient:
             f"Expected normalized URL with trailing /, got: {sent_url}"
         )
 
+    async def test_get_many_preserves_order_and_returns_exceptions(self):
+        """Test that get_many returns per-URL results in input order."""
+        client = GeminiClient()
+
+        async def mock_fetch(url):
+            if "bad" in url:
+                raise ConnectionError("Connection failed")
+            return GeminiResponse(status=20, meta="text/gemini", body="ok", url=url)
+
+        urls = [
+            "gemini://example.com/a",
+            "gemini://example.com/bad",
+            "gemini://example.com/b",
+        ]
+
+        with patch.object(client, "_get_single", new=mock_fetch):
+            results = await client.get_many(urls)
+
+        assert len(results) == 3
+        assert results[0].url == "gemini://example.com/a"
+        assert isinstance(results[1], ConnectionError)
+        assert results[2].url == "gemini://example.com/b"
+
+    async def test_get_many_respects_concurrency_limit(self):
+        """Test that get_many never exceeds the concurrency bound."""
+        client = GeminiClient()
+
+        in_flight = [0]
+        max_in_flight = [0]
+
+        async def mock_fetch(url):
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+            await asyncio.sleep(0)
+            in_flight[0] -= 1
+            return GeminiResponse(status=20, meta="text/gemini", url=url)
+
+        urls = [f"gemini://example.com/{i}" for i in range(10)]
+
+        with patch.object(client, "_get_single", new=mock_fetch):
+            results = await client.get_many(urls, concurrency=2)
+
+        assert len(results) == 10
+        assert max_in_flight[0] <= 2
+
+    async def test_peek_certificate_returns_peer_cert(self, mocker):
+        """Test that peek_certificate connects and returns the peer cert."""
+        client = GeminiClient(verify_ssl=False, trust_on_first_use=False)
+
+        sentinel_cert = object()
+
+        async def mock_create_connection(protocol_factory, **kwargs):
+            protocol = protocol_factory()
+            transport = mocker.Mock()
+            protocol.connection_made(transport)
+            mocker.patch.object(
+                protocol, "get_peer_certificate", return_value=sentinel_cert
+            )
+            return transport, protocol
+
+        with patch("asyncio.get_running_loop") as mock_loop:
+            loop = asyncio.get_event_loop()
+            mock_loop.return_value = loop
+
+            with patch.object(
+                loop, "create_connection", side_effect=mock_create_connection
+            ):
+                cert = await client.peek_certificate("example.com", 1965)
+
+        assert cert is sentinel_cert
+
 
 class TestClientCertificates:
     """Tests for client certificate support."""
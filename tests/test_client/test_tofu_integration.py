@@ -1,6 +1,7 @@
 """Tests for TOFU client integration."""
 
 import asyncio
+import sqlite3
 from pathlib import Path
 
 from cryptography import x509
@@ -116,6 +117,47 @@ class TestTOFUDatabaseOperations:
         assert is_valid is True
         assert message == "first_use"
 
+    def test_tofu_db_verify_many_matches_verify(
+        self,
+        temp_tofu_db: TOFUDatabase,
+        test_cert: x509.Certificate,
+        test_cert_different: x509.Certificate,
+    ):
+        """Test that verify_many gives per-host results matching verify."""
+        # Trust two hosts with the first cert
+        temp_tofu_db.trust("example.com", 1965, test_cert)
+        temp_tofu_db.trust("other.example", 1965, test_cert)
+
+        results = temp_tofu_db.verify_many(
+            [
+                ("example.com", 1965, test_cert),  # matches
+                ("other.example", 1965, test_cert_different),  # changed
+                ("new.example", 1965, test_cert),  # first use
+            ]
+        )
+
+        assert results == [(True, ""), (False, "changed"), (True, "first_use")]
+
+    def test_tofu_db_verify_many_empty(self, temp_tofu_db: TOFUDatabase):
+        """Test that verify_many handles an empty batch."""
+        assert temp_tofu_db.verify_many([]) == []
+
+    def test_tofu_db_uses_wal_journal(self, tmp_path: Path, test_cert: x509.Certificate):
+        """Test that the database persistently runs in WAL mode."""
+        db_path = tmp_path / "tofu.db"
+        db = TOFUDatabase(db_path)
+
+        db.trust("example.com", 1965, test_cert)
+
+        # journal_mode=WAL is persistent, so even a fresh connection that
+        # sets no pragmas must report it
+        conn = sqlite3.connect(str(db_path))
+        try:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        finally:
+            conn.close()
+        assert mode == "wal"
+
 
 class TestGeminiClientProtocolCertificateExtraction:
     """Test certificate extraction from client protocol."""
@@ -147,6 +189,37 @@ class TestGeminiClientProtocolCertificateExtraction:
         mock_transport.get_extra_info.assert_called_once_with("ssl_object")
         mock_ssl_object.getpeercert.assert_called_once_with(binary_form=True)
 
+    async def test_get_peer_certificate_caches_parsed_result(
+        self, mocker, test_cert: x509.Certificate
+    ):
+        """Test that repeated calls reuse the parsed certificate."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        protocol = GeminiClientProtocol("gemini://test.example.com/", future)
+
+        mock_ssl_object = mocker.Mock()
+        cert_der = test_cert.public_bytes(encoding=serialization.Encoding.DER)
+        mock_ssl_object.getpeercert.return_value = cert_der
+
+        mock_transport = mocker.Mock()
+        mock_transport.get_extra_info.return_value = mock_ssl_object
+
+        protocol.transport = mock_transport
+
+        load_der = mocker.patch(
+            "nauyaca.client.protocol.x509.load_der_x509_certificate",
+            wraps=x509.load_der_x509_certificate,
+        )
+
+        first = protocol.get_peer_certificate()
+        second = protocol.get_peer_certificate()
+
+        assert first is second
+        # The transport is queried each time, but the DER bytes are only
+        # parsed once
+        assert mock_transport.get_extra_info.call_count == 2
+        load_der.assert_called_once_with(cert_der)
+
     async def test_get_peer_certificate_no_transport(self):
         """Test getting peer certificate when transport is None."""
         loop = asyncio.get_running_loop()
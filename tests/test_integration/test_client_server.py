@@ -5,6 +5,7 @@ functionality with real network connections and TLS.
 """
 
 import asyncio
+import socket
 import ssl
 from pathlib import Path
 
@@ -81,6 +82,7 @@ async def lightweight_server(unused_tcp_port, tmp_path):
         "127.0.0.1",
         unused_tcp_port,
         ssl=ssl_context,
+        reuse_port=hasattr(socket, "SO_REUSEPORT"),
     )
 
     # Wait for server to be ready
@@ -5,6 +5,7 @@ correctly in a real end-to-end scenario with actual network connections.
 """
 
 import asyncio
+import socket
 import ssl
 from pathlib import Path
 
@@ -577,6 +578,7 @@ async def server_with_cert_required(unused_tcp_port, tmp_path):
         config.host,
         config.port,
         ssl=ssl_context,
+        reuse_port=hasattr(socket, "SO_REUSEPORT"),
     )
 
     yield {
@@ -48,13 +48,12 @@ class TestGeminiServerProtocol:
         # Send request
         protocol.data_received(b"gemini://example.com/\r\n")
 
-        # Verify response was sent
-        assert transport.write.call_count == 2  # Header + body
-        header_call = transport.write.call_args_list[0]
-        body_call = transport.write.call_args_list[1]
+        # Verify header and body were sent in a single coalesced write
+        transport.writelines.assert_called_once()
+        header, body = transport.writelines.call_args[0][0]
 
-        assert b"20 text/gemini\r\n" in header_call[0]
-        assert b"# Welcome\nHello World" in body_call[0]
+        assert header == b"20 text/gemini\r\n"
+        assert body == b"# Welcome\nHello World"
 
         # Verify connection was closed
         transport.close.assert_called_once()
@@ -92,7 +91,7 @@ class TestGeminiServerProtocol:
 
         # Should only send response after complete request
         transport.close.assert_called_once()
-        assert transport.write.call_count == 2
+        transport.writelines.assert_called_once()
 
     def test_error_response_invalid_utf8(self, mocker):
         """Test error response for invalid UTF-8 encoding."""
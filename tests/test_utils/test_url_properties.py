@@ -111,16 +111,12 @@ class TestURLParsingProperties:
         """validate_url should not raise for valid URLs."""
         validate_url(url)  # Should not raise
 
-    @given(
-        st.text(
-            alphabet=st.characters(blacklist_categories=("Cs",)),
-            min_size=1,
-            max_size=20,
-        )
-    )
+    @given(st.from_regex(r"[A-Za-z][A-Za-z0-9+.\-]{0,19}", fullmatch=True))
     def test_invalid_scheme_raises(self, scheme):
         """URLs with non-gemini schemes should raise ValueError."""
-        assume(scheme != "gemini")
+        # Schemes are case-insensitive (urlparse lowercases them), so
+        # "GEMINI" is the gemini scheme, not an invalid one
+        assume(scheme.lower() != "gemini")
         url = f"{scheme}://example.com/"
 
         try: